@@ -201,8 +201,8 @@ class GratitudeProxy:
         week_total = sum([self.weekly_data.get(date, 0) for date in list(self.weekly_data.keys())[-7:]]) + self.daily_count
         week_avg = week_total / 7 if week_total > 0 else 0
         
-        # All-time total
-        all_time_total = self.total_count + sum(self.weekly_data.values()) + self.daily_count
+        # All-time total (total_count is bumped on every count)
+        all_time_total = self.total_count
         
         stats = [
             (f"Today: {self.daily_count}", Color.GREEN),
@@ -415,12 +415,20 @@ class GratitudeProxy:
                 
         return streak
         
+    def poll_buttons(self):
+        """Poll debounced button presses as a bitmask (A=1, Y=2, X=4, B=8)"""
+        pressed = self.buttons.is_pressed
+        return pressed('A') | (pressed('Y') << 1) | (pressed('X') << 2) | (pressed('B') << 3)
+        
     def update(self):
         """Update Gratitude Proxy app"""
         self.check_new_day()
         
+        # is_pressed debounces each button itself, so nothing blocks here
+        pressed = self.poll_buttons()
+        
         # Count gratitude
-        if self.buttons.is_pressed('A'):
+        if pressed & 1:
             if self.view_mode == "counter":
                 self.daily_count += 1
                 self.total_count += 1
@@ -432,10 +440,9 @@ class GratitudeProxy:
                 time.sleep_ms(600)
                 
                 self.draw_screen()
-                time.sleep_ms(200)
                 
         # Switch between views
-        if self.buttons.is_pressed('Y'):
+        if pressed & 2:
             if self.view_mode == "counter":
                 self.view_mode = "weekly"
             elif self.view_mode == "weekly":
@@ -443,9 +450,8 @@ class GratitudeProxy:
             elif self.view_mode == "stats":
                 self.view_mode = "counter"
             self.draw_screen()
-            time.sleep_ms(200)
             
-        if self.buttons.is_pressed('X'):
+        if pressed & 4:
             if self.view_mode == "counter":
                 self.view_mode = "stats"
             elif self.view_mode == "weekly":
@@ -453,10 +459,9 @@ class GratitudeProxy:
             elif self.view_mode == "stats":
                 self.view_mode = "weekly"
             self.draw_screen()
-            time.sleep_ms(200)
             
         # Check for exit
-        if self.buttons.is_pressed('B'):
+        if pressed & 8:
             return False
             
         return True
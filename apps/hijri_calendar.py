@@ -6,9 +6,82 @@ Displays current Hijri date, upcoming Islamic events, and month information
 import time
 import math
 import machine
+from array import array
 from lib.st7789 import Color
 
+# Umm al-Qura month start Julian day numbers, one row per Hijri year from
+# 1440 AH, plus the start of 1471 AH as an end marker (generated offline
+# with the hijridate package)
+_UMM_AL_QURA_FIRST_YEAR = 1440
+_MONTH_START_JD = array('i', (
+    2458373, 2458402, 2458432, 2458461, 2458491, 2458521, 2458551, 2458580, 2458610, 2458639, 2458669, 2458698,
+    2458727, 2458757, 2458786, 2458816, 2458845, 2458875, 2458905, 2458934, 2458964, 2458994, 2459023, 2459053,
+    2459082, 2459111, 2459141, 2459170, 2459200, 2459229, 2459259, 2459288, 2459318, 2459348, 2459377, 2459407,
+    2459436, 2459466, 2459495, 2459525, 2459554, 2459584, 2459613, 2459643, 2459672, 2459702, 2459731, 2459761,
+    2459791, 2459820, 2459850, 2459879, 2459909, 2459939, 2459968, 2459997, 2460027, 2460056, 2460086, 2460115,
+    2460145, 2460174, 2460204, 2460234, 2460264, 2460293, 2460323, 2460352, 2460381, 2460411, 2460440, 2460469,
+    2460499, 2460528, 2460558, 2460588, 2460618, 2460647, 2460677, 2460707, 2460736, 2460765, 2460795, 2460824,
+    2460853, 2460883, 2460912, 2460942, 2460972, 2461002, 2461031, 2461061, 2461090, 2461120, 2461149, 2461179,
+    2461208, 2461237, 2461267, 2461296, 2461326, 2461356, 2461385, 2461415, 2461445, 2461474, 2461504, 2461533,
+    2461563, 2461592, 2461621, 2461651, 2461680, 2461710, 2461739, 2461769, 2461799, 2461828, 2461858, 2461888,
+    2461917, 2461947, 2461976, 2462006, 2462035, 2462064, 2462094, 2462123, 2462153, 2462182, 2462212, 2462242,
+    2462271, 2462301, 2462331, 2462360, 2462390, 2462419, 2462448, 2462478, 2462507, 2462537, 2462566, 2462596,
+    2462625, 2462655, 2462685, 2462715, 2462744, 2462774, 2462803, 2462832, 2462862, 2462891, 2462921, 2462950,
+    2462980, 2463009, 2463039, 2463069, 2463099, 2463128, 2463157, 2463187, 2463216, 2463246, 2463275, 2463305,
+    2463334, 2463363, 2463393, 2463423, 2463453, 2463482, 2463512, 2463541, 2463571, 2463600, 2463630, 2463659,
+    2463689, 2463718, 2463747, 2463777, 2463807, 2463836, 2463866, 2463895, 2463925, 2463955, 2463984, 2464014,
+    2464043, 2464073, 2464102, 2464131, 2464161, 2464190, 2464220, 2464249, 2464279, 2464309, 2464339, 2464368,
+    2464398, 2464427, 2464457, 2464486, 2464515, 2464545, 2464574, 2464603, 2464633, 2464663, 2464692, 2464722,
+    2464752, 2464782, 2464811, 2464841, 2464870, 2464899, 2464929, 2464958, 2464987, 2465017, 2465047, 2465076,
+    2465106, 2465136, 2465166, 2465195, 2465225, 2465254, 2465283, 2465313, 2465342, 2465371, 2465401, 2465431,
+    2465460, 2465490, 2465520, 2465549, 2465579, 2465608, 2465638, 2465667, 2465697, 2465726, 2465755, 2465785,
+    2465815, 2465844, 2465874, 2465903, 2465933, 2465963, 2465992, 2466022, 2466051, 2466081, 2466110, 2466140,
+    2466169, 2466199, 2466228, 2466258, 2466287, 2466317, 2466346, 2466376, 2466405, 2466435, 2466465, 2466494,
+    2466524, 2466553, 2466583, 2466612, 2466641, 2466671, 2466700, 2466730, 2466760, 2466789, 2466819, 2466849,
+    2466878, 2466908, 2466937, 2466967, 2466996, 2467025, 2467055, 2467084, 2467114, 2467143, 2467173, 2467203,
+    2467233, 2467262, 2467292, 2467321, 2467351, 2467380, 2467409, 2467439, 2467468, 2467497, 2467527, 2467557,
+    2467587, 2467617, 2467646, 2467676, 2467705, 2467735, 2467764, 2467793, 2467823, 2467852, 2467882, 2467911,
+    2467941, 2467971, 2468000, 2468030, 2468060, 2468089, 2468119, 2468148, 2468177, 2468207, 2468236, 2468266,
+    2468295, 2468325, 2468354, 2468384, 2468414, 2468443, 2468473, 2468502, 2468532, 2468561, 2468591, 2468620,
+    2468650, 2468679, 2468708, 2468738, 2468768, 2468797, 2468827, 2468857, 2468886, 2468916, 2468946, 2468975,
+    2469004, 2469034, 2469063, 2469092, 2469122, 2469152, 2469181, 2469211, 2469240, 2469270, 2469300, 2469330,
+    2469359
+))
+
+
+def _bisect_left(seq, value):
+    """Index of the first item in sorted seq that is >= value"""
+    lo, hi = 0, len(seq)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if seq[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 class HijriCalendar:
+    # Centred x for the fixed-width "(DD/MM/YYYY)" Gregorian date
+    _GREG_X = (240 - 10 * 8) // 2
+    
+    # Tabular Hijri month lengths (alternating 30/29 days)
+    _DAYS_IN_MONTH = b'\x1e\x1d\x1e\x1d\x1e\x1d\x1e\x1d\x1e\x1d\x1e\x1d'
+    
+    # Views redrawn periodically while open
+    _AUTO_REFRESH_VIEWS = frozenset(("events", "months", "converter"))
+    
+    # Special month indicators shown on the main view
+    _MONTH_LABEL = {
+        1: ("Sacred Month", Color.PURPLE),            # Muharram
+        7: ("Sacred Month", Color.PURPLE),            # Rajab
+        8: ("Month before Ramadan", Color.BLUE),      # Sha'ban
+        9: ("Holy Month of Fasting", Color.GREEN),    # Ramadan
+        10: ("Month after Ramadan", Color.CYAN),      # Shawwal
+        11: ("Sacred Month", Color.PURPLE),           # Dhu al-Qi'dah
+        12: ("Sacred Month - Hajj", Color.PURPLE)     # Dhu al-Hijjah
+    }
+    
     def __init__(self, display, joystick, buttons):
         """Initialize Hijri Calendar app"""
         self.display = display
@@ -36,22 +109,44 @@ class HijriCalendar:
             "Ramadan", "Shawwal", "Dhu al-Qi", "Dhu al-Hij"
         ]
         
-        # Important Islamic events with Hijri dates
-        self.islamic_events = [
-            {'name': 'Hijri New Year', 'month': 1, 'day': 1, 'type': 'celebration'},
-            {'name': 'Ashura', 'month': 1, 'day': 10, 'type': 'observance'},
-            {'name': 'Mawlid al-Nabi', 'month': 3, 'day': 12, 'type': 'celebration'},
-            {'name': 'Isra wal Mi\'raj', 'month': 7, 'day': 27, 'type': 'observance'},
-            {'name': 'Nisf Sha\'ban', 'month': 8, 'day': 15, 'type': 'observance'},
-            {'name': 'Ramadan Begins', 'month': 9, 'day': 1, 'type': 'month_start'},
-            {'name': 'Laylat al-Qadr', 'month': 9, 'day': 27, 'type': 'sacred_night'},
-            {'name': 'Eid al-Fitr', 'month': 10, 'day': 1, 'type': 'celebration'},
-            {'name': 'Hajj Season', 'month': 12, 'day': 8, 'type': 'pilgrimage'},
-            {'name': 'Day of Arafah', 'month': 12, 'day': 9, 'type': 'sacred_day'},
-            {'name': 'Eid al-Adha', 'month': 12, 'day': 10, 'type': 'celebration'},
-            {'name': 'Days of Tashreeq', 'month': 12, 'day': 11, 'type': 'observance'}
+        # Important Islamic events with Hijri dates, stored as parallel
+        # sequences (ordered by date) to avoid per-event dict lookups
+        self._ev_name = [
+            'Hijri New Year', 'Ashura', 'Mawlid al-Nabi', 'Isra wal Mi\'raj',
+            'Nisf Sha\'ban', 'Ramadan Begins', 'Laylat al-Qadr', 'Eid al-Fitr',
+            'Hajj Season', 'Day of Arafah', 'Eid al-Adha', 'Days of Tashreeq'
+        ]
+        self._ev_month = bytes([1, 1, 3, 7, 8, 9, 9, 10, 12, 12, 12, 12])
+        self._ev_day = bytes([1, 10, 12, 27, 15, 1, 27, 1, 8, 9, 10, 11])
+        self._ev_type = [
+            'celebration', 'observance', 'celebration', 'observance',
+            'observance', 'month_start', 'sacred_night', 'celebration',
+            'pilgrimage', 'sacred_day', 'celebration', 'observance'
         ]
         
+        # Display colour for each event type (others are white)
+        self._type_colors = {
+            'celebration': Color.GREEN,
+            'sacred_day': Color.YELLOW,
+            'sacred_night': Color.YELLOW,
+            'observance': Color.CYAN,
+            'month_start': Color.PURPLE
+        }
+        
+        # Day-of-year at the start of each month
+        self._cum_days = [0]
+        for length in self._DAYS_IN_MONTH:
+            self._cum_days.append(self._cum_days[-1] + length)
+            
+        # Event day-of-year offsets for binary search lookups
+        self._event_keys = [
+            self._cum_days[self._ev_month[i] - 1] + self._ev_day[i]
+            for i in range(len(self._ev_name))
+        ]
+        
+        # Reused result list for get_upcoming_events
+        self._upcoming_buf = []
+        
         # Reference dates for accurate Hijri conversion
         # Based on verified Islamic calendar sources
         self.reference_dates = [
@@ -62,14 +157,46 @@ class HijriCalendar:
             (2025, 6, 26, 1447, 1, 1),   # Muharram 1, 1447 (estimated)
         ]
         
+        # Julian day of each reference date, computed once
+        self._reference_jds = [
+            (self.gregorian_to_julian(y, m, d), hy, hm, hd)
+            for (y, m, d, hy, hm, hd) in self.reference_dates
+        ]
+        
+        # Current Hijri date, cached per Gregorian day
+        self._hijri_cache_key = None
+        self._hijri_cache_val = None
+        
+        # Next event, cached per Hijri (month, day)
+        self._next_event_cache_key = None
+        self._next_event_cache_val = None
+        
+        # Auto-refresh timer for secondary views
+        self._last_refresh = time.ticks_ms()
+        
+        # Button presses are ignored until this tick (replaces blocking debounce)
+        self._cooldown_until = time.ticks_ms()
+        
+        # (view, selection, hijri date) of the frame currently on screen
+        self._last_draw_signature = None
+        
     def init(self):
         """Initialize app when opened"""
         self.view_mode = "main"
         self.selected_option = 0
+        self._last_draw_signature = None
+        # Seed from now; a stale deadline reads as future once ticks pass 2^29
+        self._cooldown_until = time.ticks_ms()
         self.draw_screen()
         
     def draw_screen(self):
         """Draw the appropriate screen"""
+        # Skip the redraw when the same view and date are already shown
+        signature = (self.view_mode, self.selected_option) + self.get_current_hijri_date()
+        if signature == self._last_draw_signature:
+            return
+        self._last_draw_signature = signature
+        
         self.display.fill(Color.BLACK)
         
         if self.view_mode == "main":
@@ -85,8 +212,10 @@ class HijriCalendar:
         
     def draw_main_view(self):
         """Draw main Hijri calendar view"""
+        text = self.display.text
+        
         # Header
-        self.display.text("HIJRI CALENDAR", 65, 5, Color.CYAN)
+        text("HIJRI CALENDAR", 65, 5, Color.CYAN)
         
         # Get current dates
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
@@ -96,20 +225,19 @@ class HijriCalendar:
         month_name = self.hijri_months_short[hijri_month - 1] if 1 <= hijri_month <= 12 else "Unknown"
         hijri_date = f"{hijri_day} {month_name}"
         date_x = (240 - len(hijri_date) * 8) // 2
-        self.display.text(hijri_date, date_x, 30, Color.YELLOW)
+        text(hijri_date, date_x, 30, Color.YELLOW)
         
         # Hijri year
         year_str = f"{hijri_year} AH"
         year_x = (240 - len(year_str) * 8) // 2
-        self.display.text(year_str, year_x, 50, Color.WHITE)
+        text(year_str, year_x, 50, Color.WHITE)
         
         # Gregorian date for reference
         greg_date = f"{greg_day:02d}/{greg_month:02d}/{greg_year}"
-        greg_x = (240 - len(greg_date) * 8) // 2
-        self.display.text(f"({greg_date})", greg_x, 70, Color.GRAY)
+        text(f"({greg_date})", self._GREG_X, 70, Color.GRAY)
         
         # Current month information
-        self.display.text("Current Month:", 20, 95, Color.WHITE)
+        text("Current Month:", 20, 95, Color.WHITE)
         full_month_name = self.hijri_months[hijri_month - 1] if 1 <= hijri_month <= 12 else "Unknown"
         
         # Truncate long month names
@@ -118,58 +246,50 @@ class HijriCalendar:
         else:
             display_month = full_month_name
             
-        self.display.text(display_month, 20, 115, Color.ORANGE)
+        text(display_month, 20, 115, Color.ORANGE)
         
         # Special month indicators
-        if hijri_month == 1:  # Muharram
-            self.display.text("Sacred Month", 20, 135, Color.PURPLE)
-        elif hijri_month == 7:  # Rajab
-            self.display.text("Sacred Month", 20, 135, Color.PURPLE)
-        elif hijri_month == 8:  # Sha'ban
-            self.display.text("Month before Ramadan", 20, 135, Color.BLUE)
-        elif hijri_month == 9:  # Ramadan
-            self.display.text("Holy Month of Fasting", 20, 135, Color.GREEN)
+        label = self._MONTH_LABEL.get(hijri_month)
+        if label:
+            text(label[0], 20, 135, label[1])
+        if hijri_month == 9:  # Ramadan
             ramadan_text = f"Ramadan Day {hijri_day}"
-            self.display.text(ramadan_text, 20, 155, Color.GREEN)
-        elif hijri_month == 10:  # Shawwal
-            self.display.text("Month after Ramadan", 20, 135, Color.CYAN)
-        elif hijri_month == 11:  # Dhu al-Qi'dah
-            self.display.text("Sacred Month", 20, 135, Color.PURPLE)
-        elif hijri_month == 12:  # Dhu al-Hijjah
-            self.display.text("Sacred Month - Hajj", 20, 135, Color.PURPLE)
+            text(ramadan_text, 20, 155, Color.GREEN)
             
         # Month progress
-        days_in_month = 30 if hijri_month % 2 == 1 else 29
+        days_in_month = self._DAYS_IN_MONTH[hijri_month - 1]
         if hijri_month == 12:  # Dhu al-Hijjah sometimes has 30 days
             days_in_month = 30
             
         progress = (hijri_day / days_in_month) * 100
         progress_text = f"Month: {progress:.0f}% complete"
-        self.display.text(progress_text, 20, 175, Color.GRAY)
+        text(progress_text, 20, 175, Color.GRAY)
         
         # Next upcoming event
         next_event, days_until = self.get_next_islamic_event(hijri_month, hijri_day)
         if next_event:
-            self.display.text("Next Event:", 20, 195, Color.WHITE)
+            text("Next Event:", 20, 195, Color.WHITE)
             
             # Truncate event name if too long
             event_display = next_event[:25] if len(next_event) > 25 else next_event
-            self.display.text(event_display, 20, 210, Color.YELLOW)
+            text(event_display, 20, 210, Color.YELLOW)
             
             if days_until == 0:
-                self.display.text("TODAY!", 160, 210, Color.GREEN)
+                text("TODAY!", 160, 210, Color.GREEN)
             elif days_until == 1:
-                self.display.text("Tomorrow", 160, 210, Color.CYAN)
+                text("Tomorrow", 160, 210, Color.CYAN)
             else:
                 days_text = f"{days_until}d"
-                self.display.text(days_text, 200, 210, Color.ORANGE)
+                text(days_text, 200, 210, Color.ORANGE)
                 
         # Navigation instructions
-        self.display.text("A:Events Y:Months X:Convert", 25, 230, Color.GRAY)
+        text("A:Events Y:Months X:Convert", 25, 230, Color.GRAY)
         
     def draw_events_view(self):
         """Draw Islamic events view"""
-        self.display.text("ISLAMIC EVENTS", 70, 5, Color.CYAN)
+        text = self.display.text
+        
+        text("ISLAMIC EVENTS", 70, 5, Color.CYAN)
         
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
         
@@ -177,10 +297,11 @@ class HijriCalendar:
         upcoming_events = self.get_upcoming_events(hijri_month, hijri_day)
         
         y_pos = 30
-        self.display.text("Upcoming Events:", 10, y_pos, Color.WHITE)
+        text("Upcoming Events:", 10, y_pos, Color.WHITE)
         y_pos += 20
         
-        for i, (event, days_until, event_month, event_day) in enumerate(upcoming_events[:6]):
+        for n in range(min(6, len(upcoming_events))):
+            event, days_until, event_month, event_day, ev_idx = upcoming_events[n]
             if y_pos > 190:  # Don't overflow screen
                 break
                 
@@ -188,50 +309,40 @@ class HijriCalendar:
             event_display = event[:22] if len(event) > 22 else event
             
             # Color coding by event type
-            event_data = next((e for e in self.islamic_events if e['name'] == event), None)
-            if event_data:
-                if event_data['type'] == 'celebration':
-                    color = Color.GREEN
-                elif event_data['type'] == 'sacred_day' or event_data['type'] == 'sacred_night':
-                    color = Color.YELLOW
-                elif event_data['type'] == 'observance':
-                    color = Color.CYAN
-                elif event_data['type'] == 'month_start':
-                    color = Color.PURPLE
-                else:
-                    color = Color.WHITE
-            else:
-                color = Color.WHITE
+            color = self._type_colors.get(self._ev_type[ev_idx], Color.WHITE)
                 
-            self.display.text(event_display, 10, y_pos, color)
+            text(event_display, 10, y_pos, color)
             
             # Date and countdown
             if days_until == 0:
-                self.display.text("TODAY", 180, y_pos, Color.GREEN)
+                text("TODAY", 180, y_pos, Color.GREEN)
             elif days_until == 1:
-                self.display.text("TMRW", 185, y_pos, Color.YELLOW)
+                text("TMRW", 185, y_pos, Color.YELLOW)
             elif days_until < 30:
-                self.display.text(f"{days_until}d", 200, y_pos, Color.ORANGE)
+                text(f"{days_until}d", 200, y_pos, Color.ORANGE)
             else:
                 month_name = self.hijri_months_short[event_month - 1]
                 date_str = f"{event_day} {month_name[:6]}"
                 date_x = 240 - len(date_str) * 8
-                self.display.text(date_str, date_x, y_pos, Color.GRAY)
+                text(date_str, date_x, y_pos, Color.GRAY)
                 
             y_pos += 18
             
         # Legend
         legend_y = 200
-        self.display.text("Colors:", 10, legend_y, Color.WHITE)
-        self.display.text("Celebration", 10, legend_y + 15, Color.GREEN)
-        self.display.text("Sacred", 100, legend_y + 15, Color.YELLOW)
-        self.display.text("Observance", 150, legend_y + 15, Color.CYAN)
+        text("Colors:", 10, legend_y, Color.WHITE)
+        text("Celebration", 10, legend_y + 15, Color.GREEN)
+        text("Sacred", 100, legend_y + 15, Color.YELLOW)
+        text("Observance", 150, legend_y + 15, Color.CYAN)
         
-        self.display.text("Press B to go back", 60, 235, Color.GRAY)
+        text("Press B to go back", 60, 235, Color.GRAY)
         
     def draw_months_view(self):
         """Draw Hijri months information view"""
-        self.display.text("HIJRI MONTHS", 75, 5, Color.CYAN)
+        text = self.display.text
+        fill_rect = self.display.fill_rect
+        
+        text("HIJRI MONTHS", 75, 5, Color.CYAN)
         
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
         
@@ -245,7 +356,7 @@ class HijriCalendar:
             
             # Highlight current month
             if month == hijri_month:
-                self.display.fill_rect(5, y_pos - 2, 230, 16, Color.BLUE)
+                fill_rect(5, y_pos - 2, 230, 16, Color.BLUE)
                 text_color = Color.WHITE
                 name_color = Color.YELLOW
             else:
@@ -254,47 +365,49 @@ class HijriCalendar:
                 
             # Month number and name
             month_text = f"{month:2d}. {month_name}"
-            self.display.text(month_text, 10, y_pos, name_color)
+            text(month_text, 10, y_pos, name_color)
             
             # Month characteristics
             if month in [1, 7, 11, 12]:  # Sacred months
-                self.display.text("Sacred", 180, y_pos, Color.PURPLE)
+                text("Sacred", 180, y_pos, Color.PURPLE)
             elif month == 9:  # Ramadan
-                self.display.text("Fasting", 175, y_pos, Color.GREEN)
+                text("Fasting", 175, y_pos, Color.GREEN)
             elif month == 12:  # Dhu al-Hijjah
-                self.display.text("Hajj", 190, y_pos, Color.ORANGE)
+                text("Hajj", 190, y_pos, Color.ORANGE)
                 
             y_pos += 20
             
         # Sacred months explanation
-        self.display.text("Sacred Months:", 10, y_pos + 10, Color.WHITE)
-        self.display.text("Muharram, Rajab,", 10, y_pos + 25, Color.PURPLE)
-        self.display.text("Dhu al-Qi'dah, Dhu al-Hijjah", 10, y_pos + 40, Color.PURPLE)
+        text("Sacred Months:", 10, y_pos + 10, Color.WHITE)
+        text("Muharram, Rajab,", 10, y_pos + 25, Color.PURPLE)
+        text("Dhu al-Qi'dah, Dhu al-Hijjah", 10, y_pos + 40, Color.PURPLE)
         
-        self.display.text("Press B to go back", 60, 235, Color.GRAY)
+        text("Press B to go back", 60, 235, Color.GRAY)
         
     def draw_converter_view(self):
         """Draw date converter view"""
-        self.display.text("DATE CONVERTER", 65, 5, Color.CYAN)
+        text = self.display.text
+        
+        text("DATE CONVERTER", 65, 5, Color.CYAN)
         
         # Get current dates
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
         greg_year, greg_month, greg_day, _, _, _, _, _ = self.rtc.datetime()
         
         # Today's conversion
-        self.display.text("Today's Date:", 10, 30, Color.WHITE)
+        text("Today's Date:", 10, 30, Color.WHITE)
         
         # Gregorian
         greg_str = f"Gregorian: {greg_day:02d}/{greg_month:02d}/{greg_year}"
-        self.display.text(greg_str, 10, 50, Color.YELLOW)
+        text(greg_str, 10, 50, Color.YELLOW)
         
         # Hijri
         month_name = self.hijri_months_short[hijri_month - 1]
         hijri_str = f"Hijri: {hijri_day} {month_name} {hijri_year}"
-        self.display.text(hijri_str, 10, 70, Color.GREEN)
+        text(hijri_str, 10, 70, Color.GREEN)
         
         # Sample conversions for reference
-        self.display.text("Reference Dates:", 10, 100, Color.WHITE)
+        text("Reference Dates:", 10, 100, Color.WHITE)
         
         y_pos = 120
         sample_dates = [
@@ -309,8 +422,8 @@ class HijriCalendar:
             if y_pos > 200:
                 break
                 
-            self.display.text(greg_date, 10, y_pos, Color.CYAN)
-            self.display.text("=", 85, y_pos, Color.WHITE)
+            text(greg_date, 10, y_pos, Color.CYAN)
+            text("=", 85, y_pos, Color.WHITE)
             
             # Truncate Hijri date if too long
             if len(hijri_date) > 18:
@@ -318,37 +431,47 @@ class HijriCalendar:
             else:
                 hijri_display = hijri_date
                 
-            self.display.text(hijri_display, 100, y_pos, Color.ORANGE)
+            text(hijri_display, 100, y_pos, Color.ORANGE)
             y_pos += 15
             
         # Note about estimates
-        self.display.text("* = Estimated", 10, 210, Color.GRAY)
-        self.display.text("Lunar months vary by region", 10, 225, Color.GRAY)
+        text("* = Estimated", 10, 210, Color.GRAY)
+        text("Lunar months vary by region", 10, 225, Color.GRAY)
         
-        self.display.text("Press B to go back", 60, 5, Color.GRAY)
+        text("Press B to go back", 60, 5, Color.GRAY)
         
     def get_current_hijri_date(self):
         """Calculate current Hijri date"""
         try:
             year, month, day, _, _, _, _, _ = self.rtc.datetime()
-            return self.gregorian_to_hijri(year, month, day)
+            key = (year, month, day)
+            if key != self._hijri_cache_key:
+                self._hijri_cache_val = self.gregorian_to_hijri(year, month, day)
+                self._hijri_cache_key = key
+            return self._hijri_cache_val
         except:
             return 1446, 3, 12  # Default fallback
             
     def gregorian_to_hijri(self, year, month, day):
-        """Convert Gregorian date to Hijri using reference dates"""
+        """Convert Gregorian date to Hijri (Umm al-Qura table, reference dates outside it)"""
         target_jd = self.gregorian_to_julian(year, month, day)
         
+        # Exact lookup within the Umm al-Qura table
+        if _MONTH_START_JD[0] <= target_jd < _MONTH_START_JD[-1]:
+            i = _bisect_left(_MONTH_START_JD, target_jd + 1) - 1
+            hijri_year, hijri_month = divmod(i, 12)
+            return (hijri_year + _UMM_AL_QURA_FIRST_YEAR, hijri_month + 1,
+                    target_jd - _MONTH_START_JD[i] + 1)
+            
         # Find closest reference date
         best_ref = None
         min_diff = float('inf')
         
-        for ref_greg_y, ref_greg_m, ref_greg_d, ref_hij_y, ref_hij_m, ref_hij_d in self.reference_dates:
-            ref_jd = self.gregorian_to_julian(ref_greg_y, ref_greg_m, ref_greg_d)
-            diff = abs(target_jd - ref_jd)
+        for ref in self._reference_jds:
+            diff = abs(target_jd - ref[0])
             if diff < min_diff:
                 min_diff = diff
-                best_ref = (ref_jd, ref_hij_y, ref_hij_m, ref_hij_d)
+                best_ref = ref
                 
         if best_ref is None:
             # Fallback calculation
@@ -357,22 +480,23 @@ class HijriCalendar:
         ref_jd, ref_hij_y, ref_hij_m, ref_hij_d = best_ref
         
         # Calculate days difference
-        days_diff = int(target_jd - ref_jd)
+        days_diff = target_jd - ref_jd
         
-        # Approximate Hijri calculation from reference
-        hijri_days = (ref_hij_y - 1) * 354 + (ref_hij_m - 1) * 29.5 + ref_hij_d + days_diff
+        # Approximate Hijri calculation from reference, counted in half-days
+        # so the 29.5-day average month stays in integer arithmetic
+        hijri_half_days = (ref_hij_y - 1) * 708 + (ref_hij_m - 1) * 59 + 2 * (ref_hij_d + days_diff)
         
-        hijri_year = int(hijri_days / 354) + 1
-        remaining_days = hijri_days - (hijri_year - 1) * 354
+        hijri_year = hijri_half_days // 708 + 1
+        remaining = hijri_half_days - (hijri_year - 1) * 708
         
-        hijri_month = int(remaining_days / 29.5) + 1
-        hijri_day = int(remaining_days - (hijri_month - 1) * 29.5)
+        hijri_month = remaining // 59 + 1
+        hijri_day = (remaining - (hijri_month - 1) * 59) // 2
         
         # Ensure valid ranges
         hijri_month = max(1, min(12, hijri_month))
         hijri_day = max(1, min(30, hijri_day))
         
-        return int(hijri_year), int(hijri_month), int(hijri_day)
+        return hijri_year, hijri_month, hijri_day
         
     def simple_gregorian_to_hijri(self, year, month, day):
         """Simple Hijri conversion for fallback"""
@@ -393,130 +517,102 @@ class HijriCalendar:
         return int(hijri_year), int(hijri_month), int(hijri_day)
         
     def gregorian_to_julian(self, year, month, day):
-        """Convert Gregorian date to Julian day number"""
-        if month <= 2:
-            year -= 1
-            month += 12
-            
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)
+        """Convert Gregorian date to Julian day number (integer arithmetic)"""
+        # Shift the year to start in March so every term stays positive
+        a = (14 - month) // 12
+        y = year + 4800 - a
+        m = month + 12 * a - 3
+        
+        return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
         
-        return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
+    def find_event_index(self, doy):
+        """Index of the first event on or after the given day-of-year"""
+        return _bisect_left(self._event_keys, doy)
         
     def get_next_islamic_event(self, current_month, current_day):
         """Get next Islamic event"""
-        # Find the next event in the current year
-        for event in self.islamic_events:
-            if (event['month'] > current_month or 
-                (event['month'] == current_month and event['day'] >= current_day)):
-                
-                days_until = self.calculate_days_until_event(
-                    current_month, current_day, event['month'], event['day']
-                )
-                return event['name'], days_until
-                
+        key = (current_month, current_day)
+        if key != self._next_event_cache_key:
+            self._next_event_cache_val = self.find_next_islamic_event(current_month, current_day)
+            self._next_event_cache_key = key
+        return self._next_event_cache_val
+        
+    def find_next_islamic_event(self, current_month, current_day):
+        """Look up the next Islamic event and days until it"""
+        current_doy = self._cum_days[current_month - 1] + current_day
+        idx = self.find_event_index(current_doy)
+        
+        # Next event in the current year
+        if idx < len(self._event_keys):
+            return self._ev_name[idx], self._event_keys[idx] - current_doy
+            
         # If no events left this year, return first event of next year
-        first_event = self.islamic_events[0]
-        days_until = self.calculate_days_until_next_year_event(
-            current_month, current_day, first_event['month'], first_event['day']
-        )
-        return first_event['name'], days_until
+        return self._ev_name[0], self._cum_days[12] - current_doy + self._event_keys[0]
         
     def get_upcoming_events(self, current_month, current_day):
-        """Get list of upcoming events"""
-        upcoming = []
-        
-        # Events in current year
-        for event in self.islamic_events:
-            if (event['month'] > current_month or 
-                (event['month'] == current_month and event['day'] >= current_day)):
-                
-                days_until = self.calculate_days_until_event(
-                    current_month, current_day, event['month'], event['day']
-                )
-                upcoming.append((event['name'], days_until, event['month'], event['day']))
-                
-        # Add next year events if needed
-        if len(upcoming) < 8:
-            for event in self.islamic_events:
-                if len(upcoming) >= 8:
-                    break
+        """Get list of upcoming (name, days_until, month, day, index) events
+        
+        The returned list is reused between calls.
+        """
+        current_doy = self._cum_days[current_month - 1] + current_day
+        keys = self._event_keys
+        count = len(keys)
+        idx = self.find_event_index(current_doy)
+        upcoming = self._upcoming_buf
+        upcoming.clear()
+        
+        # Events in current year (already sorted by days until)
+        for i in range(idx, count):
+            upcoming.append((self._ev_name[i], keys[i] - current_doy,
+                             self._ev_month[i], self._ev_day[i], i))
                     
-                days_until = self.calculate_days_until_next_year_event(
-                    current_month, current_day, event['month'], event['day']
-                )
-                upcoming.append((event['name'], days_until, event['month'], event['day']))
-                
-        # Sort by days until
-        upcoming.sort(key=lambda x: x[1])
-        return upcoming
-        
-    def calculate_days_until_event(self, current_month, current_day, event_month, event_day):
-        """Calculate days until event in same Hijri year"""
-        if current_month == event_month:
-            return max(0, event_day - current_day)
-            
-        # Simplified calculation using average month length
-        days = 0
-        
-        # Days remaining in current month
-        days_in_month = [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29]
-        days += days_in_month[current_month - 1] - current_day
-        
-        # Days in intervening months
-        for month in range(current_month + 1, event_month):
-            days += days_in_month[month - 1]
-            
-        # Days in event month
-        days += event_day
-        
-        return days
-        
-    def calculate_days_until_next_year_event(self, current_month, current_day, event_month, event_day):
-        """Calculate days until event in next Hijri year"""
-        days_in_month = [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29]
-        
-        # Days remaining in current year
-        days = days_in_month[current_month - 1] - current_day
-        for month in range(current_month + 1, 13):
-            days += days_in_month[month - 1]
+        # Add next year events if needed
+        days_left = self._cum_days[12] - current_doy
+        for i in range(count):
+            if len(upcoming) >= 8:
+                break
+            upcoming.append((self._ev_name[i], days_left + keys[i],
+                             self._ev_month[i], self._ev_day[i], i))
             
-        # Days from beginning of next year to event
-        for month in range(1, event_month):
-            days += days_in_month[month - 1]
-        days += event_day
+        return upcoming
         
-        return days
+    def poll_buttons(self):
+        """Poll debounced button presses as a bitmask (A=1, Y=2, X=4, B=8)"""
+        pressed = self.buttons.is_pressed
+        return pressed('A') | (pressed('Y') << 1) | (pressed('X') << 2) | (pressed('B') << 3)
         
     def update(self):
         """Update Hijri Calendar app"""
-        if self.view_mode == "main":
-            if self.buttons.is_pressed('A'):
-                self.view_mode = "events"
-                self.draw_screen()
-                time.sleep_ms(200)
-            elif self.buttons.is_pressed('Y'):
-                self.view_mode = "months"
-                self.draw_screen()
-                time.sleep_ms(200)
-            elif self.buttons.is_pressed('X'):
-                self.view_mode = "converter"
-                self.draw_screen()
-                time.sleep_ms(200)
-                
-        elif self.view_mode in ["events", "months", "converter"]:
-            # Auto-refresh these views periodically
-            if time.ticks_ms() % 10000 == 0:  # Every 10 seconds
-                self.draw_screen()
+        now = time.ticks_ms()
+        
+        # Input is ignored during the cooldown after a handled press
+        if time.ticks_diff(now, self._cooldown_until) >= 0:
+            pressed = self.poll_buttons()
+            if pressed:
+                self._cooldown_until = time.ticks_add(now, 200)
                 
-        # Check for exit
-        if self.buttons.is_pressed('B'):
             if self.view_mode == "main":
-                return False
-            else:
+                if pressed & 8:
+                    return False
+                elif pressed & 1:
+                    self.view_mode = "events"
+                    self.draw_screen()
+                elif pressed & 2:
+                    self.view_mode = "months"
+                    self.draw_screen()
+                elif pressed & 4:
+                    self.view_mode = "converter"
+                    self.draw_screen()
+            elif pressed & 8:
+                # Back to main view
                 self.view_mode = "main"
                 self.draw_screen()
-                time.sleep_ms(200)
+                
+        if self.view_mode in self._AUTO_REFRESH_VIEWS:
+            # Auto-refresh these views periodically
+            if time.ticks_diff(now, self._last_refresh) >= 10000:  # Every 10 seconds
+                self._last_refresh = now
+                self.draw_screen()
                 
         return True
         
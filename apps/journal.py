@@ -5,15 +5,24 @@ Pick words from a curated list to describe your day
 
 import time
 import os
+import machine
 from lib.st7789 import Color
 
 class MicroJournal:
+    # Centred x positions for fixed strings
+    _TITLE_X = (240 - len("3 Words Today") * 8) // 2
+    _COMPLETE_TITLE_X = (240 - len("Today's Words") * 8) // 2
+    _SAVED_X = (240 - len("Saved!") * 8) // 2
+    
     def __init__(self, display, joystick, buttons):
         """Initialize the micro-journal app"""
         self.display = display
         self.joystick = joystick
         self.buttons = buttons
         
+        # RTC for entry dates
+        self._rtc = machine.RTC()
+        
         # Word categories and options
         self.categories = {
             "Mood": ["happy", "calm", "tired", "excited", "anxious", "peaceful", "energetic", "thoughtful"],
@@ -21,41 +30,58 @@ class MicroJournal:
             "Theme": ["productive", "creative", "social", "quiet", "challenging", "learning", "routine", "adventurous"]
         }
         
+        # Category names and word lists in display order
+        self._cat_names = tuple(self.categories.keys())
+        self._cat_words = tuple(self.categories.values())
+        
+        # Highlight width of each word cell, per category
+        self._word_widths = tuple(
+            tuple(len(word) * 8 + 4 for word in words)
+            for words in self._cat_words
+        )
+        
         self.selected_words = []
         self.current_category = 0
         self.current_word_index = 0
         self.csv_file = "/stores/journal.csv"
         
+        # Button presses are ignored until this tick (replaces blocking debounce)
+        self._cooldown_until = time.ticks_ms()
+        
     def init(self):
         """Initialize app when opened"""
         self.selected_words = []
         self.current_category = 0
         self.current_word_index = 0
+        # Seed from now; a stale deadline reads as future once ticks pass 2^29
+        self._cooldown_until = time.ticks_ms()
         self.draw_screen()
         
     def draw_screen(self):
         """Draw the journal screen"""
+        text = self.display.text
+        fill_rect = self.display.fill_rect
+        
         self.display.fill(Color.BLACK)
         
         # Title
-        title = "3 Words Today"
-        title_x = (240 - len(title) * 8) // 2
-        self.display.text(title, title_x, 10, Color.GREEN)
+        text("3 Words Today", self._TITLE_X, 10, Color.GREEN)
         
         # Show selected words at top
         y_pos = 35
         for i, word in enumerate(self.selected_words):
-            text = f"{i+1}. {word}"
-            self.display.text(text, 20, y_pos, Color.CYAN)
+            line = f"{i+1}. {word}"
+            text(line, 20, y_pos, Color.CYAN)
             y_pos += 15
             
         # Show current category
         if self.current_category < len(self.categories):
-            cat_name = list(self.categories.keys())[self.current_category]
-            cat_words = self.categories[cat_name]
+            cat_name = self._cat_names[self.current_category]
+            cat_words = self._cat_words[self.current_category]
+            word_widths = self._word_widths[self.current_category]
             
             # Category title
-            self.display.text(f"Choose {cat_name}:", 20, 90, Color.YELLOW)
+            text(f"Choose {cat_name}:", 20, 90, Color.YELLOW)
             
             # Show word options in a grid
             words_per_row = 2
@@ -69,25 +95,36 @@ class MicroJournal:
                 
                 # Highlight selected word
                 if i == self.current_word_index:
-                    self.display.fill_rect(x - 2, y - 2, len(word) * 8 + 4, 12, Color.WHITE)
-                    self.display.text(word, x, y, Color.BLACK)
+                    fill_rect(x - 2, y - 2, word_widths[i], 12, Color.WHITE)
+                    text(word, x, y, Color.BLACK)
                 else:
-                    self.display.text(word, x, y, Color.GRAY)
+                    text(word, x, y, Color.GRAY)
                     
         # Instructions
         if len(self.selected_words) < 3:
-            self.display.text("Joy:Select A:Choose", 30, 215, Color.GRAY)
-            self.display.text("B:Home", 90, 225, Color.GRAY)
+            text("Joy:Select A:Choose", 30, 215, Color.GRAY)
+            text("B:Home", 90, 225, Color.GRAY)
         else:
-            self.display.text("A:Save B:Home", 70, 220, Color.GRAY)
+            text("A:Save B:Home", 70, 220, Color.GRAY)
             
         self.display.display()
         
+    def poll_buttons(self):
+        """Poll debounced button presses as a bitmask (A=1, B=2)"""
+        return self.buttons.is_pressed('A') | (self.buttons.is_pressed('B') << 1)
+        
     def update(self):
         """Update journal app"""
+        now = time.ticks_ms()
+        pressed = 0
+        
+        # Input is ignored during the cooldown after a handled press
+        if time.ticks_diff(now, self._cooldown_until) >= 0:
+            pressed = self.poll_buttons()
+            
         # Check if we've selected all 3 words
         if len(self.selected_words) >= 3:
-            if self.buttons.is_pressed('A'):
+            if pressed & 1:
                 self.save_entry()
                 return True  # Keep app running
                 
@@ -95,7 +132,8 @@ class MicroJournal:
             # Navigate words - use slow response like tamagotchi menu
             direction = self.joystick.get_direction_slow()
             if direction:
-                cat_words = list(self.categories.values())[self.current_category]
+                cat_words = self._cat_words[self.current_category]
+                old_index = self.current_word_index
                 
                 if direction == 'UP':
                     self.current_word_index = max(0, self.current_word_index - 2)
@@ -108,13 +146,15 @@ class MicroJournal:
                     if self.current_word_index % 2 == 0 and self.current_word_index < len(cat_words) - 1:
                         self.current_word_index += 1
                         
-                self.draw_screen()
+                # Only the old and new highlighted cells change
+                if self.current_word_index != old_index:
+                    self._redraw_word(old_index)
+                    self._redraw_word(self.current_word_index)
+                    self.display.display()
                 
             # Select word
-            if self.buttons.is_pressed('A'):
-                cat_name = list(self.categories.keys())[self.current_category]
-                cat_words = self.categories[cat_name]
-                selected = cat_words[self.current_word_index]
+            if pressed & 1:
+                selected = self._cat_words[self.current_category][self.current_word_index]
                 
                 self.selected_words.append(selected)
                 self.current_category += 1
@@ -126,44 +166,56 @@ class MicroJournal:
                 else:
                     self.draw_screen()
                     
-                time.sleep_ms(200)  # Debounce
+                self._cooldown_until = time.ticks_add(now, 200)  # Debounce
                 
         # Check for exit
-        if self.buttons.is_pressed('B'):
+        if pressed & 2:
             return False  # Exit app
             
         return True  # Keep running
         
+    def _redraw_word(self, index):
+        """Clear and redraw a single word cell of the current category"""
+        word = self._cat_words[self.current_category][index]
+        width = self._word_widths[self.current_category][index]
+        x = 20 + (index % 2) * 100
+        y = 110 + (index // 2) * 20
+        
+        if index == self.current_word_index:
+            self.display.fill_rect(x - 2, y - 2, width, 12, Color.WHITE)
+            self.display.text(word, x, y, Color.BLACK)
+        else:
+            self.display.fill_rect(x - 2, y - 2, width, 12, Color.BLACK)
+            self.display.text(word, x, y, Color.GRAY)
+            
     def draw_complete_screen(self):
         """Show completion screen"""
+        text = self.display.text
+        
         self.display.fill(Color.BLACK)
         
         # Title
-        title = "Today's Words"
-        title_x = (240 - len(title) * 8) // 2
-        self.display.text(title, title_x, 40, Color.GREEN)
+        text("Today's Words", self._COMPLETE_TITLE_X, 40, Color.GREEN)
         
         # Show selected words centered
         y_pos = 80
         for word in self.selected_words:
             x = (240 - len(word) * 8) // 2
-            self.display.text(word, x, y_pos, Color.CYAN)
+            text(word, x, y_pos, Color.CYAN)
             y_pos += 25
             
         # Date
         try:
-            import machine
-            rtc = machine.RTC()
-            date_tuple = rtc.datetime()
+            date_tuple = self._rtc.datetime()
             date_str = f"{date_tuple[2]}/{date_tuple[1]}/{date_tuple[0]}"
         except:
             date_str = "Today"
             
         date_x = (240 - len(date_str) * 8) // 2
-        self.display.text(date_str, date_x, 170, Color.YELLOW)
+        text(date_str, date_x, 170, Color.YELLOW)
         
         # Instructions
-        self.display.text("A:Save B:Home", 70, 220, Color.GRAY)
+        text("A:Save B:Home", 70, 220, Color.GRAY)
         
         self.display.display()
         
@@ -172,9 +224,7 @@ class MicroJournal:
         try:
             # Get current date/time
             try:
-                import machine
-                rtc = machine.RTC()
-                dt = rtc.datetime()
+                dt = self._rtc.datetime()
                 date_str = f"{dt[0]}-{dt[1]:02d}-{dt[2]:02d}"
                 time_str = f"{dt[4]:02d}:{dt[5]:02d}"
             except:
@@ -184,15 +234,13 @@ class MicroJournal:
             # Create CSV line
             csv_line = f"{date_str},{time_str},{','.join(self.selected_words)}\n"
             
-            # Append to file
+            # Append to file before reporting success, one write per entry
             with open(self.csv_file, 'a') as f:
                 f.write(csv_line)
                 
             # Show success message
             self.display.fill(Color.BLACK)
-            msg = "Saved!"
-            x = (240 - len(msg) * 8) // 2
-            self.display.text(msg, x, 110, Color.GREEN)
+            self.display.text("Saved!", self._SAVED_X, 110, Color.GREEN)
             self.display.display()
             time.sleep_ms(1000)
             
@@ -4,12 +4,75 @@ Track daily medication intake with weekly calendar view
 Stores progress in JSON format for long-term tracking
 """
 
+from micropython import const
 import time
-import json
 import gc
+import os
+
+# Prefer MicroPython's C implementations
+try:
+    import ujson as json
+except ImportError:
+    import json
+try:
+    import ubinascii as binascii
+except ImportError:
+    import binascii
 from lib.st7789 import Color
 
+_SECS_PER_DAY = const(86400)
+_STREAK_MAX = const(365)
+_NUM_DAYS = const(7)
+
+# Input debounce: day navigation, and week navigation or button presses
+_NAV_DELAY_MS = const(150)
+_WEEK_DELAY_MS = const(200)
+
+# Weekly calendar grid placement
+_GRID_Y = const(58)
+_DAY_HEIGHT = const(60)
+
+# Days per month for a common year
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _days_in_month(y, m):
+    """Number of days in month m of year y"""
+    if m == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        return 29
+    return _MONTH_DAYS[m - 1]
+
+def _advance(y, m, d):
+    """Return the (year, month, day) following the given date"""
+    if d < _days_in_month(y, m):
+        return y, m, d + 1
+    if m < 12:
+        return y, m + 1, 1
+    return y + 1, 1, 1
+
+# Day-of-year offsets on a leap-year calendar, so every date has a fixed bit
+_DOY_OFFSET = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+_BITMAP_BYTES = const(46)  # 368 bits per year
+
+def _day_bit(date_str):
+    """Return (year, byte index, bit mask) of a YYYY-MM-DD date in the taken bitmaps"""
+    doy = _DOY_OFFSET[int(date_str[5:7]) - 1] + int(date_str[8:10]) - 1
+    return int(date_str[:4]), doy >> 3, 1 << (doy & 7)
+
+def _prev_day(y, m, d):
+    """Return the (year, month, day) preceding the given date"""
+    if d > 1:
+        return y, m, d - 1
+    if m > 1:
+        return y, m - 1, _days_in_month(y, m - 1)
+    return y - 1, 12, 31
+
 class MedTracker:
+    # Day cell colours
+    _C_SEL_BG = Color.rgb565(40, 60, 80)
+    _C_TAKEN = Color.rgb565(0, 100, 0)
+    _C_MISSED = Color.rgb565(100, 0, 0)
+    _C_FUTURE = Color.rgb565(30, 30, 30)
+    
     def __init__(self, display, joystick, buttons):
         """Initialize MedTracker app"""
         self.display = display
@@ -23,6 +86,7 @@ class MedTracker:
         # Calendar navigation
         self.selected_day = 0  # 0-6 (Monday to Sunday)
         self.current_week_offset = 0  # Weeks from current week
+        self._cached_week_dates = None  # Dates shown by the last weekly redraw
         
         # Settings
         self.med_name = "Medication"
@@ -31,8 +95,44 @@ class MedTracker:
         
         # Data storage
         self.data_file = "/stores/med_tracker_data.json"
+        self._stats_dirty = True
         self.med_data = self.load_data()
         
+        # Taken flags as one bitmap per year; records keep only doses and time
+        self._taken = {}
+        if "taken_bits" in self.med_data:
+            for year, bits in self.med_data["taken_bits"].items():
+                self._taken[int(year)] = bytearray(binascii.a2b_base64(bits))
+        else:
+            # One-shot conversion from per-record "taken" flags
+            for date_str, record in self.med_data["records"].items():
+                if record.pop("taken", False):
+                    self._set_taken(date_str, True)
+        
+        # Taken-day count kept up to date by toggle_med_status
+        if "_taken_count" not in self.med_data:
+            self.med_data["_taken_count"] = self.count_taken_days()
+        
+        # Streak as of a given date, reused until the day changes or a record is toggled
+        self._streak_cache = self.med_data.setdefault("streak_cache", {"date": None, "streak": 0})
+        
+        # Deferred saving: changes are flushed at most every 5 seconds
+        self._dirty = False
+        self._last_save = 0
+        self._save_buf = None  # Bytes of the last successful save
+        
+        # Last drawn stat values and their label strings and colours
+        self._last_streak = None
+        self._streak_text = ""
+        self._streak_color = Color.GRAY
+        self._last_compliance = None
+        self._compliance_text = ""
+        self._compliance_color = Color.RED
+        
+        # Non-blocking input debounce
+        self._last_input_ms = 0
+        self._input_delay_ms = 0
+        
         # Week days for display
         self.weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         self.weekdays_full = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -43,17 +143,46 @@ class MedTracker:
         self.view_mode = "weekly"
         self.selected_day = self.get_current_weekday()
         self.current_week_offset = 0
+        self._cached_week_dates = None
+        
+        # Autosave interval counts from opening; a boot-time seed stops
+        # comparing as past once ticks_ms passes 2^29
+        self._last_save = time.ticks_ms()
+        
+        # Same for the input debounce, otherwise every press is swallowed
+        self._last_input_ms = time.ticks_ms()
+        self._input_delay_ms = 0
+        
+        # Calendar cell geometry (weekday abbreviations are 3 chars, day numbers 2)
+        self._day_width = (self.display.width - 20) // 7
+        self._day_abbr_dx = (self._day_width - 3 * 8) // 2
+        self._day_num_dx = (self._day_width - 2 * 8) // 2
+        
+        # Fixed strings and their positions
+        width = self.display.width
+        self._title_xy = ((width - len("MedTracker") * 8) // 2, 8)
+        self._settings_title_x = (width - len("MedTracker Settings") * 8) // 2
+        self._stats_title_x = (width - len("Medication Stats") * 8) // 2
+        self._footer1 = "L/R:Day U/D:Week A:Toggle"
+        self._footer2 = "X:Stats Y:Settings B:Exit"
+        self._inst_back_x = (width - len("B:Back to Calendar") * 8) // 2
+        
         self.draw_screen()
         
     def cleanup(self):
         """Cleanup when app closes"""
-        self.save_data()
-        gc.collect()
+        if self.save_data():
+            self._dirty = False
+        
+        # Only pay for a full collection when memory is actually tight
+        if gc.mem_free() < 20000:
+            gc.collect()
         
     def load_data(self):
         """Load medication data from JSON file"""
+        self._stats_dirty = True
         try:
-            with open(self.data_file, "r") as f:
+            with open(self.data_file, "rb") as f:
                 data = json.load(f)
                 return data
         except (OSError, ValueError):
@@ -61,23 +190,56 @@ class MedTracker:
             return {
                 "medication_name": "Medication",
                 "daily_doses": 1,
-                "records": {},  # Format: "YYYY-MM-DD": {"taken": True/False, "doses": 1, "time": "HH:MM"}
+                "records": {},  # Format: "YYYY-MM-DD": {"doses": 1, "time": "HH:MM"}
+                "taken_bits": {},  # Format: "YYYY": base64 bitmap, one bit per day
                 "streak": 0,
                 "total_days": 0,
                 "compliance_rate": 0.0
             }
     
     def save_data(self):
-        """Save medication data to JSON file"""
+        """Save medication data to JSON file, returning True on success"""
         try:
             # Update statistics before saving
             self.calculate_stats()
             
-            with open(self.data_file, "w") as f:
-                json.dump(self.med_data, f)
-                print("MedTracker: Data saved successfully")
+            # Bitmaps are stored as base64 strings keyed by year
+            taken_bits = {}
+            for year, bitmap in self._taken.items():
+                taken_bits[str(year)] = binascii.b2a_base64(bitmap)[:-1].decode()
+            self.med_data["taken_bits"] = taken_bits
+            
+            # Skip the flash write if nothing changed since the last save
+            buf = json.dumps(self.med_data).encode()
+            if buf == self._save_buf:
+                return True
+            
+            # Write to a temp file first so a partial write never replaces good data
+            tmp_file = self.data_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(buf)
+            try:
+                os.rename(tmp_file, self.data_file)
+            except OSError:
+                # Filesystems that won't rename over an existing file
+                os.remove(self.data_file)
+                os.rename(tmp_file, self.data_file)
+            
+            self._save_buf = buf
+            print("MedTracker: Data saved successfully")
+            return True
         except Exception as e:
             print(f"MedTracker: Save error - {e}")
+            return False
+    
+    def maybe_save(self):
+        """Save pending changes if the last save was over 5 seconds ago"""
+        now = time.ticks_ms()
+        if self._dirty and time.ticks_diff(now, self._last_save) > 5000:
+            # Stay dirty on failure so the next attempt retries in 5 seconds
+            if self.save_data():
+                self._dirty = False
+            self._last_save = now
     
     def get_current_weekday(self):
         """Get current day of week (0=Monday, 6=Sunday)"""
@@ -89,7 +251,7 @@ class MedTracker:
         """Get date string in YYYY-MM-DD format"""
         # Get current time and add day offset
         current_time = time.time()
-        target_time = current_time + (day_offset * 24 * 60 * 60)
+        target_time = current_time + (day_offset * _SECS_PER_DAY)
         target_tm = time.localtime(target_time)
         
         return f"{target_tm[0]:04d}-{target_tm[1]:02d}-{target_tm[2]:02d}"
@@ -101,37 +263,82 @@ class MedTracker:
         days_to_monday = -current_weekday  # Monday is 0
         week_start_offset = days_to_monday + (self.current_week_offset * 7)
         
-        week_dates = []
-        for i in range(7):
-            date_str = self.get_date_string(week_start_offset + i)
-            week_dates.append(date_str)
+        # One localtime() for Monday, the rest by calendar arithmetic
+        base_tm = time.localtime(time.time() + week_start_offset * _SECS_PER_DAY)
+        y, m, d = base_tm[0], base_tm[1], base_tm[2]
+        
+        week_dates = [None] * 7
+        for i in range(_NUM_DAYS):
+            week_dates[i] = f"{y:04d}-{m:02d}-{d:02d}"
+            y, m, d = _advance(y, m, d)
         
         return week_dates
     
+    def _recent_n_dates(self, n):
+        """Get the last n dates ending today, newest first"""
+        today_tm = time.localtime()
+        y, m, d = today_tm[0], today_tm[1], today_tm[2]
+        
+        dates = [None] * n
+        for i in range(n):
+            dates[i] = f"{y:04d}-{m:02d}-{d:02d}"
+            y, m, d = _prev_day(y, m, d)
+        
+        return dates
+    
+    def get_cached_week_dates(self):
+        """Get week dates from the last weekly redraw, recomputing if invalidated"""
+        if self._cached_week_dates is None:
+            self._cached_week_dates = self.get_week_dates()
+        return self._cached_week_dates
+    
     def is_med_taken(self, date_str):
         """Check if medication was taken on given date"""
-        return self.med_data["records"].get(date_str, {}).get("taken", False)
+        year, index, mask = _day_bit(date_str)
+        bitmap = self._taken.get(year)
+        return bitmap is not None and (bitmap[index] & mask) != 0
+    
+    def _set_taken(self, date_str, taken):
+        """Set or clear the taken bit for given date"""
+        year, index, mask = _day_bit(date_str)
+        bitmap = self._taken.get(year)
+        if bitmap is None:
+            bitmap = self._taken[year] = bytearray(_BITMAP_BYTES)
+        if taken:
+            bitmap[index] |= mask
+        else:
+            bitmap[index] &= ~mask
     
     def toggle_med_status(self, date_str):
         """Toggle medication status for given date"""
-        if date_str not in self.med_data["records"]:
-            self.med_data["records"][date_str] = {}
-        
-        current_status = self.med_data["records"][date_str].get("taken", False)
-        new_status = not current_status
+        record = self.med_data["records"].setdefault(date_str, {})
+        new_status = not self.is_med_taken(date_str)
+        self._set_taken(date_str, new_status)
+        self.med_data["_taken_count"] += 1 if new_status else -1
         
         # Get current time for timestamp
         now = time.localtime()
         time_str = f"{now[3]:02d}:{now[4]:02d}"
         
-        self.med_data["records"][date_str] = {
-            "taken": new_status,
-            "doses": self.daily_doses if new_status else 0,
-            "time": time_str if new_status else None
-        }
+        record["doses"] = self.daily_doses if new_status else 0
+        record["time"] = time_str if new_status else None
         
-        # Auto-save after changes
-        self.save_data()
+        # Streak and stats must be recounted after any change
+        self._streak_cache["date"] = None
+        self._stats_dirty = True
+        
+        # Saved later by maybe_save() or cleanup()
+        self._dirty = True
+    
+    def count_taken_days(self):
+        """Count days marked as taken across all bitmaps"""
+        taken_days = 0
+        for bitmap in self._taken.values():
+            for byte in bitmap:
+                while byte:
+                    byte &= byte - 1
+                    taken_days += 1
+        return taken_days
     
     def calculate_stats(self):
         """Calculate medication compliance statistics"""
@@ -144,24 +351,35 @@ class MedTracker:
             return
         
         # Calculate current streak (consecutive days taken)
-        current_date = self.get_date_string()
-        streak = 0
-        check_date = current_date
-        
-        # Count backwards from today
-        for i in range(365):  # Limit to avoid infinite loop
-            if self.is_med_taken(check_date):
+        today_tm = time.localtime()
+        y, m, d = today_tm[0], today_tm[1], today_tm[2]
+        current_date = f"{y:04d}-{m:02d}-{d:02d}"
+        cache = self._streak_cache
+        
+        if cache["date"] != current_date:
+            streak = 0
+            check_date = current_date
+            
+            # Count backwards from today until the cached date is reached
+            for i in range(_STREAK_MAX):  # Limit to avoid infinite loop
+                if check_date == cache["date"]:
+                    streak = min(streak + cache["streak"], _STREAK_MAX)
+                    break
+                if not self.is_med_taken(check_date):
+                    break
                 streak += 1
                 # Move to previous day
-                yesterday_time = time.time() - ((i + 1) * 24 * 60 * 60)
-                yesterday_tm = time.localtime(yesterday_time)
-                check_date = f"{yesterday_tm[0]:04d}-{yesterday_tm[1]:02d}-{yesterday_tm[2]:02d}"
-            else:
-                break
+                y, m, d = _prev_day(y, m, d)
+                check_date = f"{y:04d}-{m:02d}-{d:02d}"
+            
+            cache["date"] = current_date
+            cache["streak"] = streak
+        
+        streak = cache["streak"]
         
         # Calculate total compliance
         total_days = len(self.med_data["records"])
-        taken_days = sum(1 for record in self.med_data["records"].values() if record.get("taken", False))
+        taken_days = self.med_data["_taken_count"]
         compliance_rate = (taken_days / total_days * 100) if total_days > 0 else 0.0
         
         self.med_data.update({
@@ -185,96 +403,105 @@ class MedTracker:
     
     def draw_weekly_view(self):
         """Draw weekly medication tracking calendar"""
+        # Get dates for current week, kept for input handling
+        week_dates = self.get_week_dates()
+        self._cached_week_dates = week_dates
+        today_str = self.get_date_string()
+        
+        self._draw_week_static(today_str)
+        for i in range(_NUM_DAYS):
+            self._draw_day_cell(i, week_dates[i], today_str)
+    
+    def _draw_week_static(self, today_str):
+        """Draw the weekly view header, stats and footer"""
         # Header
-        header_y = 8
-        title = "MedTracker"
-        title_x = (self.display.width - len(title) * 8) // 2
-        self.display.text(title, title_x, header_y, Color.WHITE)
+        title_x, header_y = self._title_xy
+        self.display.text("MedTracker", title_x, header_y, Color.WHITE)
         
         # Week navigation info
-        week_info = f"Week {self.current_week_offset:+d}" if self.current_week_offset != 0 else "This Week"
+        week_info = "Week %+d" % self.current_week_offset if self.current_week_offset != 0 else "This Week"
         info_x = (self.display.width - len(week_info) * 8) // 2
         self.display.text(week_info, info_x, header_y + 20, Color.CYAN)
         
-        # Get dates for current week
-        week_dates = self.get_week_dates()
-        
-        # Calendar grid
-        grid_start_y = header_y + 50
-        day_width = (self.display.width - 20) // 7
-        day_height = 60
-        
-        for i, (day_abbr, date_str) in enumerate(zip(self.weekdays, week_dates)):
-            x = 10 + i * day_width
-            y = grid_start_y
-            
-            # Highlight selected day
-            if i == self.selected_day:
-                self.display.fill_rect(x, y, day_width, day_height, Color.rgb565(40, 60, 80))
-                self.display.rect(x, y, day_width, day_height, Color.WHITE)
-                day_color = Color.WHITE
-                status_color = Color.YELLOW
-            else:
-                day_color = Color.LIGHT_GRAY
-                status_color = Color.GRAY
-            
-            # Day abbreviation
-            day_x = x + (day_width - len(day_abbr) * 8) // 2
-            self.display.text(day_abbr, day_x, y + 5, day_color)
-            
-            # Day number (extract from date)
-            day_num = date_str.split("-")[2]
-            num_x = x + (day_width - len(day_num) * 8) // 2
-            self.display.text(day_num, num_x, y + 18, day_color)
-            
-            # Medication status indicator
-            is_taken = self.is_med_taken(date_str)
-            if is_taken:
-                # Green checkmark area
-                self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, Color.rgb565(0, 100, 0))
-                self.display.text("✓", x + day_width//2 - 4, y + 36, Color.WHITE)
-            else:
-                # Red X or empty area
-                is_future = date_str > self.get_date_string()
-                if not is_future:
-                    self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, Color.rgb565(100, 0, 0))
-                    self.display.text("✗", x + day_width//2 - 4, y + 36, Color.WHITE)
-                else:
-                    # Future day - gray
-                    self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, Color.rgb565(30, 30, 30))
-                    self.display.text("—", x + day_width//2 - 4, y + 36, Color.DARK_GRAY)
-        
         # Current medication info
-        med_y = grid_start_y + day_height + 20
+        med_y = _GRID_Y + _DAY_HEIGHT + 20
         med_name = self.med_data.get("medication_name", "Medication")
-        med_text = f"Med: {med_name}"
+        med_text = "Med: %s" % med_name
         if len(med_text) > 20:
             med_text = med_text[:17] + "..."
         self.display.text(med_text, 10, med_y, Color.CYAN)
         
-        # Quick stats
-        self.calculate_stats()
+        # Quick stats, recounted only after a change or when the day rolls over
+        if self._stats_dirty or self._streak_cache["date"] != today_str:
+            self.calculate_stats()
+            self._stats_dirty = False
         streak = self.med_data.get("streak", 0)
         compliance = self.med_data.get("compliance_rate", 0)
         
-        streak_text = f"Streak: {streak}d"
-        self.display.text(streak_text, 10, med_y + 15, Color.GREEN if streak > 0 else Color.GRAY)
+        # Labels and colours are only recomputed when their value changes
+        if streak != self._last_streak:
+            self._last_streak = streak
+            self._streak_text = "Streak: %dd" % streak
+            self._streak_color = Color.GREEN if streak > 0 else Color.GRAY
+        self.display.text(self._streak_text, 10, med_y + 15, self._streak_color)
         
-        compliance_text = f"Rate: {compliance:.0f}%"
-        comp_color = Color.GREEN if compliance >= 80 else Color.ORANGE if compliance >= 60 else Color.RED
-        self.display.text(compliance_text, 10, med_y + 30, comp_color)
+        if compliance != self._last_compliance:
+            self._last_compliance = compliance
+            self._compliance_text = "Rate: %.0f%%" % compliance
+            self._compliance_color = Color.GREEN if compliance >= 80 else Color.ORANGE if compliance >= 60 else Color.RED
+        self.display.text(self._compliance_text, 10, med_y + 30, self._compliance_color)
         
         # Instructions
         footer_y = self.display.height - 35
-        self.display.text("L/R:Day U/D:Week A:Toggle", 5, footer_y, Color.DARK_GRAY)
-        self.display.text("X:Stats Y:Settings B:Exit", 5, footer_y + 12, Color.DARK_GRAY)
+        self.display.text(self._footer1, 5, footer_y, Color.DARK_GRAY)
+        self.display.text(self._footer2, 5, footer_y + 12, Color.DARK_GRAY)
+    
+    def _draw_day_cell(self, i, date_str, today_str):
+        """Draw one day cell of the weekly calendar, clearing its background"""
+        day_width = self._day_width
+        day_height = _DAY_HEIGHT
+        x = 10 + i * day_width
+        y = _GRID_Y
+        
+        # Highlight selected day
+        if i == self.selected_day:
+            self.display.fill_rect(x, y, day_width, day_height, self._C_SEL_BG)
+            self.display.rect(x, y, day_width, day_height, Color.WHITE)
+            day_color = Color.WHITE
+            status_color = Color.YELLOW
+        else:
+            self.display.fill_rect(x, y, day_width, day_height, Color.BLACK)
+            day_color = Color.LIGHT_GRAY
+            status_color = Color.GRAY
+        
+        # Day abbreviation
+        self.display.text(self.weekdays[i], x + self._day_abbr_dx, y + 5, day_color)
+        
+        # Day number (extract from date)
+        day_num = date_str.split("-")[2]
+        self.display.text(day_num, x + self._day_num_dx, y + 18, day_color)
+        
+        # Medication status indicator
+        is_taken = self.is_med_taken(date_str)
+        if is_taken:
+            # Green checkmark area
+            self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, self._C_TAKEN)
+            self.display.text("✓", x + day_width//2 - 4, y + 36, Color.WHITE)
+        else:
+            # Red X or empty area
+            is_future = date_str > today_str
+            if not is_future:
+                self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, self._C_MISSED)
+                self.display.text("✗", x + day_width//2 - 4, y + 36, Color.WHITE)
+            else:
+                # Future day - gray
+                self.display.fill_rect(x + 2, y + 32, day_width - 4, 20, self._C_FUTURE)
+                self.display.text("—", x + day_width//2 - 4, y + 36, Color.DARK_GRAY)
     
     def draw_settings_view(self):
         """Draw settings configuration screen"""
         header_y = 8
-        title = "MedTracker Settings"
-        title_x = (self.display.width - len(title) * 8) // 2
-        self.display.text(title, title_x, header_y, Color.WHITE)
+        self.display.text("MedTracker Settings", self._settings_title_x, header_y, Color.WHITE)
         
         # Settings options
         options_y = header_y + 40
@@ -287,35 +514,36 @@ class MedTracker:
         
         # Instructions
         footer_y = self.display.height - 20
-        instructions = "B:Back to Calendar"
-        inst_x = (self.display.width - len(instructions) * 8) // 2
-        self.display.text(instructions, inst_x, footer_y, Color.GRAY)
+        self.display.text("B:Back to Calendar", self._inst_back_x, footer_y, Color.GRAY)
     
     def draw_stats_view(self):
         """Draw statistics and compliance view"""
         header_y = 8
-        title = "Medication Stats"
-        title_x = (self.display.width - len(title) * 8) // 2
-        self.display.text(title, title_x, header_y, Color.WHITE)
+        self.display.text("Medication Stats", self._stats_title_x, header_y, Color.WHITE)
+        
+        # Today and the six days before it, newest first
+        recent_dates = self._recent_n_dates(_NUM_DAYS)
         
         # Calculate and display detailed stats
-        self.calculate_stats()
+        if self._stats_dirty or self._streak_cache["date"] != recent_dates[0]:
+            self.calculate_stats()
+            self._stats_dirty = False
         
         stats_y = header_y + 35
         
         # Current streak
         streak = self.med_data.get("streak", 0)
-        streak_text = f"Current Streak: {streak} days"
+        streak_text = "Current Streak: %d days" % streak
         self.display.text(streak_text, 10, stats_y, Color.GREEN if streak > 0 else Color.GRAY)
         
         # Total tracking days
         total_days = self.med_data.get("total_days", 0)
-        total_text = f"Total Days Tracked: {total_days}"
+        total_text = "Total Days Tracked: %d" % total_days
         self.display.text(total_text, 10, stats_y + 20, Color.CYAN)
         
         # Compliance rate
         compliance = self.med_data.get("compliance_rate", 0)
-        comp_text = f"Compliance Rate: {compliance:.1f}%"
+        comp_text = "Compliance Rate: %.1f%%" % compliance
         comp_color = Color.GREEN if compliance >= 80 else Color.ORANGE if compliance >= 60 else Color.RED
         self.display.text(comp_text, 10, stats_y + 40, comp_color)
         
@@ -335,9 +563,8 @@ class MedTracker:
         
         # Show last 7 days status
         status_y = recent_y + 20
-        for i in range(7):
-            date_str = self.get_date_string(-i)
-            is_taken = self.is_med_taken(date_str)
+        for i in range(_NUM_DAYS):
+            is_taken = self.is_med_taken(recent_dates[i])
             x_pos = 10 + i * 30
             
             if is_taken:
@@ -347,14 +574,16 @@ class MedTracker:
         
         # Instructions
         footer_y = self.display.height - 20
-        instructions = "B:Back to Calendar"
-        inst_x = (self.display.width - len(instructions) * 8) // 2
-        self.display.text(instructions, inst_x, footer_y, Color.GRAY)
+        self.display.text("B:Back to Calendar", self._inst_back_x, footer_y, Color.GRAY)
     
     def handle_input(self):
         """Handle user input"""
         self.buttons.update()
         
+        # Ignore input until the delay after the last handled one has passed
+        if time.ticks_diff(time.ticks_ms(), self._last_input_ms) < self._input_delay_ms:
+            return True
+        
         if self.view_mode == "weekly":
             return self.handle_weekly_input()
         elif self.view_mode == "settings":
@@ -364,50 +593,55 @@ class MedTracker:
         
         return True
     
+    def _debounce(self, delay_ms):
+        """Start a non-blocking input delay from now"""
+        self._last_input_ms = time.ticks_ms()
+        self._input_delay_ms = delay_ms
+    
     def handle_weekly_input(self):
         """Handle input in weekly view"""
         # Navigate days (left/right)
         if not self.joystick.left_pin.value():
-            self.selected_day = max(0, self.selected_day - 1)
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._select_day(max(0, self.selected_day - 1))
+            self._debounce(_NAV_DELAY_MS)
         elif not self.joystick.right_pin.value():
-            self.selected_day = min(6, self.selected_day + 1)
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._select_day(min(6, self.selected_day + 1))
+            self._debounce(_NAV_DELAY_MS)
         
         # Navigate weeks (up/down)
         elif not self.joystick.up_pin.value():
             self.current_week_offset -= 1
+            self._cached_week_dates = None
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         elif not self.joystick.down_pin.value():
             self.current_week_offset += 1
+            self._cached_week_dates = None
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         # Toggle medication status (A button)
         elif self.buttons.is_pressed('A'):
-            week_dates = self.get_week_dates()
-            selected_date = week_dates[self.selected_day]
+            selected_date = self.get_cached_week_dates()[self.selected_day]
+            today_str = self.get_date_string()
             
             # Don't allow toggling future dates
-            if selected_date <= self.get_date_string():
+            if selected_date <= today_str:
                 self.toggle_med_status(selected_date)
                 self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         # View statistics (X button)
         elif self.buttons.is_pressed('X'):
             self.view_mode = "stats"
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         # Settings (Y button)
         elif self.buttons.is_pressed('Y'):
             self.view_mode = "settings"
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         # Exit app (B button)
         elif self.buttons.is_pressed('B'):
@@ -415,13 +649,26 @@ class MedTracker:
         
         return True
     
+    def _select_day(self, day):
+        """Move the day selection, redrawing only the two affected cells"""
+        old_day = self.selected_day
+        if day == old_day:
+            return
+        
+        self.selected_day = day
+        week_dates = self.get_cached_week_dates()
+        today_str = self.get_date_string()
+        self._draw_day_cell(old_day, week_dates[old_day], today_str)
+        self._draw_day_cell(day, week_dates[day], today_str)
+        self.display.display()
+    
     def handle_settings_input(self):
         """Handle input in settings view"""
         # Go back to weekly view
         if self.buttons.is_pressed('B'):
             self.view_mode = "weekly"
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         return True
     
@@ -431,10 +678,11 @@ class MedTracker:
         if self.buttons.is_pressed('B'):
             self.view_mode = "weekly"
             self.draw_screen()
-            time.sleep_ms(200)
+            self._debounce(_WEEK_DELAY_MS)
         
         return True
     
     def update(self):
         """Main update loop"""
+        self.maybe_save()
         return self.handle_input()
\ No newline at end of file
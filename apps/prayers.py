@@ -5,10 +5,58 @@ Based on astronomical calculations with Hijri calendar integration
 
 import time
 import math
+import array
 import machine
+import micropython
 from lib.st7789 import Color
 from lib.dst_utils import get_current_timezone_offset, format_timezone_string
 
+# Sun declination (degrees) and equation of time (hours) sampled every 6 days
+# from 1 January 2025; both are smooth enough to interpolate linearly
+_TABLE_EPOCH_JD = 2460676.5
+_TROPICAL_YEAR = 365.2422
+_DECL_TABLE = (
+    -22.9980, -22.3659, -21.4699, -20.3256, -18.9517, -17.3700, -15.6039, -13.6779,
+    -11.6169, -9.4458, -7.1892, -4.8711, -2.5148, -0.1430, 2.2221, 4.5589,
+    6.8465, 9.0640, 11.1910, 13.2073, 15.0932, 16.8295, 18.3974, 19.7795,
+    20.9595, 21.9229, 22.6575, 23.1540, 23.4058, 23.4101, 23.1673, 22.6813,
+    21.9596, 21.0124, 19.8522, 18.4941, 16.9542, 15.2501, 13.4000, 11.4226,
+    9.3368, 7.1619, 4.9173, 2.6223, 0.2969, -2.0389, -4.3645, -6.6586,
+    -8.8994, -11.0643, -13.1299, -15.0724, -16.8674, -18.4909, -19.9191, -21.1297,
+    -22.1022, -22.8193, -23.2674, -23.4375, -23.3256, -22.9332,
+)
+
+_EQT_TABLE = (
+    -0.05755, -0.10284, -0.14325, -0.17737, -0.20419, -0.22308, -0.23385, -0.23662,
+    -0.23186, -0.22027, -0.20276, -0.18037, -0.15426, -0.12562, -0.09567, -0.06563,
+    -0.03668, -0.00992, 0.01364, 0.03309, 0.04773, 0.05703, 0.06067, 0.05863,
+    0.05114, 0.03875, 0.02225, 0.00271, -0.01861, -0.04033, -0.06105, -0.07941,
+    -0.09417, -0.10432, -0.10910, -0.10801, -0.10086, -0.08774, -0.06896, -0.04509,
+    -0.01687, 0.01482, 0.04896, 0.08443, 0.12007, 0.15466, 0.18698, 0.21580,
+    0.23997, 0.25837, 0.27003, 0.27415, 0.27014, 0.25769, 0.23683, 0.20796,
+    0.17190, 0.12985, 0.08338, 0.03433, -0.01529, -0.06344,
+)
+
+# Angle conversions, kept in radians through the prayer-time math
+_DEG = math.pi / 180
+_RAD_TO_HOURS = 12 / math.pi
+_SIN_SUNRISE = math.sin(-0.833 * _DEG)
+
+# Order of the entries in the prayer-minute array; Sunrise is shown but is not a prayer
+PRAYER_NAMES = ('Fajr', 'Sunrise', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')
+_IS_PRAYER = (True, False, True, True, True, True)
+
+def _bisect_left(seq, value):
+    """Index of the first item in sorted seq that is >= value"""
+    lo, hi = 0, len(seq)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if seq[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 class Prayers:
     def __init__(self, display, joystick, buttons):
         """Initialize Prayer Times app"""
@@ -26,6 +74,7 @@ class Prayers:
         self.base_timezone = -5  # EST base timezone (standard time)
         self.dst_enabled = True  # Enable automatic DST
         self.location_name = "Tampa, FL"
+        self._update_lat_cache()
         
         # Calculation settings
         self.calculation_method = 'ISNA'  # Islamic Society of North America
@@ -39,11 +88,30 @@ class Prayers:
         }
         
         # Prayer times cache
-        self.prayer_times_cache = {}
+        self.prayer_minutes = None  # array('H') of minutes of the day, in PRAYER_NAMES order
         self.last_update_day = -1
         
+        # Formatted strings for the current day and settings
+        self._str_cache = {}
+        self._clock_cache = None
+        
+        # Hijri date cache, valid for one Gregorian date
+        self._hijri_cache = None
+        self._hijri_cache_day = None
+        
         # RTC for time keeping
         self.rtc = machine.RTC()
+        self._now_dt = self.rtc.datetime()  # Read once per update()
+        
+        # Timezone offset and label, refreshed hourly to catch DST changes
+        self._tz_offset = None
+        self._tz_str = None
+        self._tz_cache_hour = -1
+        
+        # Auto-refresh deadline and what the main view last showed
+        self._next_refresh = time.ticks_add(time.ticks_ms(), 5000)
+        self._drawn_minute = None
+        self._drawn_list = None
         
         # Hijri calendar data
         self.hijri_months = [
@@ -63,10 +131,22 @@ class Prayers:
             {'name': 'Eid al-Adha', 'month': 12, 'day': 10}
         ]
         
+        # Events as sorted 30-day-month day-of-year keys with parallel names
+        events_sorted = sorted(((e['month'] - 1) * 30 + e['day'], e['name']) for e in self.islamic_events)
+        self._event_doy = [doy for doy, _ in events_sorted]
+        self._event_names = [name for _, name in events_sorted]
+        
+    def _update_lat_cache(self):
+        """Cache latitude trig terms; call whenever latitude changes"""
+        self._lat_rad = math.radians(self.latitude)
+        self._sin_lat = math.sin(self._lat_rad)
+        self._cos_lat = math.cos(self._lat_rad)
+        
     def init(self):
         """Initialize app when opened"""
         self.view_mode = "main"
         self.selected_option = 0
+        self._now_dt = self.rtc.datetime()
         self.update_prayer_times()
         self.draw_screen()
         
@@ -82,6 +162,7 @@ class Prayers:
             self.draw_hijri_view()
             
         self.display.display()
+        self._next_refresh = time.ticks_add(time.ticks_ms(), 5000)
         
     def draw_main_view(self):
         """Draw main prayer times view"""
@@ -94,63 +175,95 @@ class Prayers:
         self.display.text(location_text, loc_x, 20, Color.GRAY)
         
         # Current time with timezone
-        try:
-            dt = self.rtc.datetime()
-            current_time = f"{dt[4]:02d}:{dt[5]:02d}"
-            tz_string = format_timezone_string(self.base_timezone, self.dst_enabled)
-            time_tz = f"{current_time} {tz_string}"
-            time_x = (240 - len(time_tz) * 8) // 2
-            self.display.text(time_tz, time_x, 35, Color.WHITE)
-        except:
-            pass
+        self.draw_clock_line()
             
         # Prayer times
-        if not self.prayer_times_cache:
+        if not self.prayer_minutes:
             self.display.text("Calculating...", 75, 100, Color.YELLOW)
         else:
             y_pos = 55
             next_prayer, next_time = self.get_next_prayer()
+            self._drawn_list = (self.last_update_day, next_prayer)
             
-            prayer_order = ['Fajr', 'Sunrise', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']
-            for prayer in prayer_order:
-                if prayer in self.prayer_times_cache:
-                    prayer_time = self.prayer_times_cache[prayer]
-                    
-                    # Highlight next prayer
-                    if prayer == next_prayer:
-                        self.display.fill_rect(15, y_pos - 2, 210, 16, Color.GREEN)
-                        prayer_color = Color.BLACK
-                        time_color = Color.BLACK
-                    else:
-                        prayer_color = Color.CYAN if prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha'] else Color.GRAY
-                        time_color = Color.WHITE
-                        
-                    # Prayer name
-                    self.display.text(prayer, 20, y_pos, prayer_color)
-                    
-                    # Prayer time
-                    self.display.text(prayer_time, 150, y_pos, time_color)
+            for i, prayer in enumerate(PRAYER_NAMES):
+                # Highlight next prayer
+                if prayer == next_prayer:
+                    self.display.fill_rect(15, y_pos - 2, 210, 16, Color.GREEN)
+                    prayer_color = Color.BLACK
+                    time_color = Color.BLACK
+                else:
+                    prayer_color = Color.CYAN if _IS_PRAYER[i] else Color.GRAY
+                    time_color = Color.WHITE
                     
-                    y_pos += 18
+                # Prayer name
+                self.display.text(prayer, 20, y_pos, prayer_color)
+                
+                # Prayer time
+                self.display.text(self.format_time(self.prayer_minutes[i]), 150, y_pos, time_color)
+                
+                y_pos += 18
                     
             # Next prayer countdown
-            if next_prayer and next_time:
-                remaining = self.calculate_time_remaining(next_time)
-                if remaining:
-                    next_text = f"Next: {next_prayer}"
-                    self.display.text(next_text, 20, 195, Color.YELLOW)
-                    self.display.text(remaining, 20, 210, Color.GREEN)
+            self.draw_countdown(next_prayer, next_time)
                     
         # Instructions
         self.display.text("A:Options Y:Hijri B:Back", 40, 225, Color.GRAY)
         
+    def draw_clock_line(self):
+        """Draw the current time and timezone line of the main view"""
+        try:
+            dt = self._now_dt
+            minute_key = (dt[4], dt[5])
+            
+            # Reformat only when the minute changes
+            if self._clock_cache is None or self._clock_cache[0] != minute_key:
+                current_time = f"{dt[4]:02d}:{dt[5]:02d}"
+                tz_string = self._tz()[1]
+                time_tz = f"{current_time} {tz_string}"
+                self._clock_cache = (minute_key, time_tz, (240 - len(time_tz) * 8) // 2)
+                
+            self.display.text(self._clock_cache[1], self._clock_cache[2], 35, Color.WHITE)
+            self._drawn_minute = (dt[4], dt[5])
+        except:
+            pass
+            
+    def draw_countdown(self, next_prayer, next_time):
+        """Draw the next prayer countdown of the main view"""
+        if next_prayer and next_time is not None:
+            remaining = self.calculate_time_remaining(next_time)
+            if remaining:
+                next_text = f"Next: {next_prayer}"
+                self.display.text(next_text, 20, 195, Color.YELLOW)
+                self.display.text(remaining, 20, 210, Color.GREEN)
+                
+    def draw_main_view_partial(self):
+        """Refresh only the clock and countdown lines of the main view"""
+        dt = self._now_dt
+        if (dt[4], dt[5]) == self._drawn_minute:
+            return
+            
+        next_prayer, next_time = self.get_next_prayer()
+        if (self.last_update_day, next_prayer) != self._drawn_list:
+            # New day's times or the highlight moved on, the list needs a full redraw
+            self.draw_screen()
+            return
+            
+        self.display.fill_rect(0, 35, 240, 8, Color.BLACK)
+        self.draw_clock_line()
+        
+        self.display.fill_rect(0, 195, 240, 23, Color.BLACK)
+        if self.prayer_minutes:
+            self.draw_countdown(next_prayer, next_time)
+            
+        self.display.display()
+        
+
     def draw_settings_view(self):
         """Draw settings view"""
         self.display.text("SETTINGS", 85, 10, Color.CYAN)
         
         # Get current timezone info
-        current_tz = get_current_timezone_offset(self.base_timezone, self.dst_enabled)
-        tz_display = format_timezone_string(self.base_timezone, self.dst_enabled)
+        current_tz, tz_display = self._tz()
         dst_status = "On" if self.dst_enabled else "Off"
         
         options = [
@@ -184,9 +297,14 @@ class Prayers:
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
         
         # Hijri date display
-        month_name = self.hijri_months[hijri_month - 1] if 1 <= hijri_month <= 12 else "Unknown"
-        hijri_date = f"{hijri_day} {month_name} {hijri_year}"
-        date_x = (240 - len(hijri_date) * 8) // 2
+        date_key = (hijri_day, hijri_month, hijri_year)
+        cached = self._str_cache.get(date_key)
+        if cached is None:
+            month_name = self.hijri_months[hijri_month - 1] if 1 <= hijri_month <= 12 else "Unknown"
+            hijri_date = f"{hijri_day} {month_name} {hijri_year}"
+            cached = (hijri_date, (240 - len(hijri_date) * 8) // 2)
+            self._str_cache[date_key] = cached
+        hijri_date, date_x = cached
         self.display.text(hijri_date, date_x, 40, Color.YELLOW)
         
         # Special month indication
@@ -218,261 +336,245 @@ class Prayers:
         
         self.display.text("Press B to go back", 60, 215, Color.GRAY)
         
+    @micropython.native
     def calculate_prayer_times(self, year, month, day):
         """Calculate prayer times for a given date"""
-        # Julian day calculation
-        julian_day = self.gregorian_to_julian(year, month, day)
-        T = (julian_day - 2451545.0) / 36525
-        
         # Solar position
-        sun_data = self.sun_position(T)
+        sun_data = self.sun_position(year, month, day)
         decl = sun_data['declination']
         eqt = sun_data['equation']
         
+        # Declination and latitude terms are constant for the day
+        sin_lat = self._sin_lat
+        cos_lat = self._cos_lat
+        decl_rad = decl * _DEG
+        sin_decl = math.sin(decl_rad)
+        cos_decl = math.cos(decl_rad)
+        
         # Solar noon (transit)
         transit = 12 - eqt
         
-        # Sunrise and sunset
-        sunrise_angle = -0.833
-        sunrise = self.calculate_horizon_time(transit, sunrise_angle, decl, False)
-        sunset = self.calculate_horizon_time(transit, sunrise_angle, decl, True)
-        
         # Get method parameters
         method = self.methods.get(self.calculation_method, self.methods['ISNA'])
+        isha_by_angle = method['isha'] <= 90
         
-        # Fajr
-        fajr_angle = -method['fajr']
-        fajr = self.calculate_horizon_time(transit, fajr_angle, decl, False)
-        
-        # Asr calculation
+        # Asr altitude from the madhab's shadow length
         shadow_factor = self.asr_madhab
-        asr_angle = math.degrees(math.atan(1.0 / (shadow_factor + math.tan(math.radians(abs(self.latitude - decl))))))
-        
-        cos_h = (math.sin(math.radians(asr_angle)) - 
-                math.sin(math.radians(decl)) * math.sin(math.radians(self.latitude))) / \
-               (math.cos(math.radians(decl)) * math.cos(math.radians(self.latitude)))
-        
-        cos_h = max(-1, min(1, cos_h))
-        asr = transit + math.degrees(math.acos(cos_h)) / 15
+        asr_rad = math.atan(1.0 / (shadow_factor + math.tan(abs(self._lat_rad - decl_rad))))
+        
+        # Horizon crossings as (sine of sun altitude, after transit):
+        # sunrise, sunset, Fajr, Asr and, unless it is a fixed delay, Isha
+        specs = [(_SIN_SUNRISE, False), (_SIN_SUNRISE, True), (-math.sin(method['fajr'] * _DEG), False),
+                 (math.sin(asr_rad), True)]
+        if isha_by_angle:
+            specs.append((-math.sin(method['isha'] * _DEG), True))
+            
+        # One pass sharing the day's declination and latitude terms
+        horizon = []
+        for sin_angle, after_transit in specs:
+            cos_h = (sin_angle - sin_decl * sin_lat) / (cos_decl * cos_lat)
+            cos_h = max(-1, min(1, cos_h))
+            hour_angle = math.acos(cos_h) * _RAD_TO_HOURS
+            horizon.append(transit + hour_angle if after_transit else transit - hour_angle)
+            
+        sunrise, sunset, fajr, asr = horizon[0], horizon[1], horizon[2], horizon[3]
         
         # Maghrib (sunset + 3 minutes)
         maghrib = sunset + 3/60
         
         # Isha
-        if method['isha'] > 90:
-            isha = maghrib + method['isha'] / 60
+        if isha_by_angle:
+            isha = horizon[4]
         else:
-            isha_angle = -method['isha']
-            isha = self.calculate_horizon_time(transit, isha_angle, decl, True)
-        
-        # Convert to time strings with timezone
-        times = {
-            'Fajr': self.hours_to_time(fajr),
-            'Sunrise': self.hours_to_time(sunrise),
-            'Dhuhr': self.hours_to_time(transit),
-            'Asr': self.hours_to_time(asr),
-            'Maghrib': self.hours_to_time(maghrib),
-            'Isha': self.hours_to_time(isha)
-        }
-        
-        return times
-        
-    def calculate_horizon_time(self, transit, angle, declination, after_transit):
-        """Calculate time for specific sun altitude angle"""
-        cos_h = (math.sin(math.radians(angle)) - 
-                math.sin(math.radians(declination)) * math.sin(math.radians(self.latitude))) / \
-               (math.cos(math.radians(declination)) * math.cos(math.radians(self.latitude)))
-        
-        cos_h = max(-1, min(1, cos_h))
-        hour_angle = math.degrees(math.acos(cos_h)) / 15
-        
-        return transit + hour_angle if after_transit else transit - hour_angle
-        
-    def sun_position(self, T):
-        """Calculate sun's declination and equation of time"""
-        # Mean solar longitude
-        L0 = (280.46646 + 36000.76983 * T) % 360
-        
-        # Mean anomaly
-        M = (357.52911 + 35999.05029 * T) % 360
-        
-        # Equation of center
-        C = (1.914602 * math.sin(math.radians(M)) + 
-             0.019993 * math.sin(math.radians(2 * M)))
-        
-        # True longitude
-        L = L0 + C
-        
-        # Obliquity
-        epsilon = 23.439 - 0.00000036 * T
-        
-        # Declination
-        decl = math.degrees(math.asin(math.sin(math.radians(epsilon)) * math.sin(math.radians(L))))
-        
-        # Right ascension
-        RA = math.degrees(math.atan2(math.cos(math.radians(epsilon)) * math.sin(math.radians(L)), 
-                                     math.cos(math.radians(L))))
-        RA = (RA + 360) % 360
+            isha = maghrib + method['isha'] / 60
         
-        # Equation of time
-        eqt = (L0 - RA) / 15
-        if eqt > 12:
-            eqt -= 24
-        elif eqt < -12:
-            eqt += 24
+        # Local minutes of the day, in PRAYER_NAMES order
+        return array.array('H', (
+            self.hours_to_minutes(fajr),
+            self.hours_to_minutes(sunrise),
+            self.hours_to_minutes(transit),
+            self.hours_to_minutes(asr),
+            self.hours_to_minutes(maghrib),
+            self.hours_to_minutes(isha),
+        ))
+        
+    @micropython.native
+    def sun_position(self, year, month, day):
+        """Interpolate sun's declination and equation of time for a date"""
+        # Position within the tropical year, which also absorbs the leap-year cycle
+        days = (self.gregorian_to_julian(year, month, day) - _TABLE_EPOCH_JD) % _TROPICAL_YEAR
+        
+        k = days / 6
+        i = int(k)
+        f = k - i
+        
+        decl = _DECL_TABLE[i] + (_DECL_TABLE[i + 1] - _DECL_TABLE[i]) * f
+        eqt = _EQT_TABLE[i] + (_EQT_TABLE[i + 1] - _EQT_TABLE[i]) * f
             
         return {'declination': decl, 'equation': eqt}
         
+    @micropython.native
     def gregorian_to_julian(self, year, month, day):
         """Convert Gregorian date to Julian day"""
         if month <= 2:
             year -= 1
             month += 12
         
-        a = math.floor(year / 100)
-        b = 2 - a + math.floor(a / 4)
+        # Integer form of floor(365.25 * y) and floor(30.6001 * m)
+        a = year // 100
+        b = 2 - a + a // 4
         
-        return math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+        return (1461 * (year + 4716)) // 4 + (153 * (month + 1)) // 5 + day + b - 1524.5
         
-    def hours_to_time(self, hours):
-        """Convert decimal hours to time string with timezone"""
+    @micropython.native
+    def hours_to_minutes(self, hours):
+        """Convert decimal hours to local minute of the day with timezone"""
         # Get current timezone offset with DST
-        current_timezone = get_current_timezone_offset(self.base_timezone, self.dst_enabled)
+        current_timezone = self._tz()[0]
         
-        # Apply timezone and longitude correction
+        # Apply timezone and longitude correction, normalized to 24-hour format
         longitude_correction = -self.longitude / 15
-        hours = hours + longitude_correction + current_timezone
+        hours = (hours + longitude_correction + current_timezone) % 24
         
-        # Normalize to 24-hour format
-        while hours < 0:
-            hours += 24
-        while hours >= 24:
-            hours -= 24
-            
         h = int(hours)
         m = int((hours - h) * 60)
         
-        return f"{h:02d}:{m:02d}"
+        return h * 60 + m
+        
+    def format_time(self, minute_of_day):
+        """Format a minute of the day as HH:MM"""
+        # Reuse the string if this minute was already formatted
+        time_str = self._str_cache.get(minute_of_day)
+        if time_str is None:
+            time_str = f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}"
+            self._str_cache[minute_of_day] = time_str
+        return time_str
+        
+    def _tz(self):
+        """Current timezone offset and label, cached for the hour"""
+        dt = self._now_dt
+        hour = dt[2] * 24 + dt[4]  # Also changes if the clock is set to a new date
+        if hour != self._tz_cache_hour or self._tz_offset is None:
+            self._tz_offset = get_current_timezone_offset(self.base_timezone, self.dst_enabled)
+            self._tz_str = format_timezone_string(self.base_timezone, self.dst_enabled)
+            self._tz_cache_hour = hour
+        return self._tz_offset, self._tz_str
         
     def update_prayer_times(self):
         """Update prayer times for current day"""
         try:
-            year, month, day, _, _, _, _, _ = self.rtc.datetime()
+            year, month, day, _, _, _, _, _ = self._now_dt
             
             if day != self.last_update_day:
-                self.prayer_times_cache = self.calculate_prayer_times(year, month, day)
+                self._str_cache = {}
+                self.prayer_minutes = self.calculate_prayer_times(year, month, day)
                 self.last_update_day = day
                 
         except Exception as e:
             print(f"Prayer times calculation error: {e}")
             
     def get_next_prayer(self):
-        """Get next prayer and time"""
-        if not self.prayer_times_cache:
+        """Get next prayer and its minute of the day"""
+        minutes = self.prayer_minutes
+        if not minutes:
             return None, None
             
-        try:
-            _, _, _, _, hour, minute, _, _ = self.rtc.datetime()
-            current_minutes = hour * 60 + minute
-            
-            prayer_order = ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']
-            
-            for prayer in prayer_order:
-                if prayer in self.prayer_times_cache:
-                    prayer_time = self.prayer_times_cache[prayer]
-                    prayer_hour, prayer_min = map(int, prayer_time.split(':'))
-                    prayer_minutes = prayer_hour * 60 + prayer_min
-                    
-                    if prayer_minutes > current_minutes:
-                        return prayer, prayer_time
-            
-            # Next is Fajr tomorrow
-            return 'Fajr', self.prayer_times_cache.get('Fajr', '--:--')
-        except:
-            return None, None
+        _, _, _, _, hour, minute, _, _ = self._now_dt
+        current_minutes = hour * 60 + minute
+        
+        for i in range(len(PRAYER_NAMES)):
+            if _IS_PRAYER[i] and minutes[i] > current_minutes:
+                return PRAYER_NAMES[i], minutes[i]
+                
+        # Next is Fajr tomorrow
+        return 'Fajr', minutes[0]
             
-    def calculate_time_remaining(self, prayer_time):
+    def calculate_time_remaining(self, prayer_minutes):
         """Calculate time remaining until prayer"""
-        try:
-            _, _, _, _, hour, minute, _, _ = self.rtc.datetime()
-            current_minutes = hour * 60 + minute
-            
-            prayer_hour, prayer_min = map(int, prayer_time.split(':'))
-            prayer_minutes = prayer_hour * 60 + prayer_min
-            
-            if prayer_minutes <= current_minutes:
-                prayer_minutes += 24 * 60  # Next day
-                
-            remaining = prayer_minutes - current_minutes
-            hours = remaining // 60
-            mins = remaining % 60
+        _, _, _, _, hour, minute, _, _ = self._now_dt
+        current_minutes = hour * 60 + minute
+        
+        if prayer_minutes <= current_minutes:
+            prayer_minutes += 24 * 60  # Next day
             
-            if hours > 0:
-                return f"{hours}h {mins}m"
-            else:
-                return f"{mins}m"
-        except:
-            return None
+        remaining = prayer_minutes - current_minutes
+        hours = remaining // 60
+        mins = remaining % 60
+        
+        if hours > 0:
+            return f"{hours}h {mins}m"
+        else:
+            return f"{mins}m"
             
     def get_current_hijri_date(self):
         """Get current Hijri date (simplified calculation)"""
         try:
-            year, month, day, _, _, _, _, _ = self.rtc.datetime()
+            year, month, day, _, _, _, _, _ = self._now_dt
+            
+            # The Hijri date only changes with the Gregorian date
+            date_key = (year, month, day)
+            if date_key == self._hijri_cache_day:
+                return self._hijri_cache
             
             # Simplified Hijri conversion (approximate)
             # Based on average lunar year of 354.37 days
             greg_epoch = self.gregorian_to_julian(622, 7, 16)  # Hijri epoch
             current_jd = self.gregorian_to_julian(year, month, day)
             
-            days_since_epoch = current_jd - greg_epoch
-            hijri_year = int(days_since_epoch / 354.37) + 1
+            # Work in hundredths of a day so the divisions stay integer
+            days_100 = int(current_jd - greg_epoch + 0.5) * 100
+            hijri_year = days_100 // 35437 + 1
             
-            days_in_year = days_since_epoch - (hijri_year - 1) * 354.37
-            hijri_month = int(days_in_year / 29.53) + 1
-            hijri_day = int(days_in_year - (hijri_month - 1) * 29.53) + 1
+            days_in_year_100 = days_100 - (hijri_year - 1) * 35437
+            hijri_month = days_in_year_100 // 2953 + 1
+            hijri_day = (days_in_year_100 - (hijri_month - 1) * 2953) // 100 + 1
             
             # Ensure valid ranges
             hijri_month = max(1, min(12, hijri_month))
             hijri_day = max(1, min(30, hijri_day))
             
-            return int(hijri_year), int(hijri_month), int(hijri_day)
+            self._hijri_cache = (hijri_year, hijri_month, hijri_day)
+            self._hijri_cache_day = date_key
+            return self._hijri_cache
         except:
             return 1446, 3, 12  # Default date
             
     def get_next_islamic_event(self, current_month, current_day):
         """Get next Islamic event"""
-        for event in self.islamic_events:
-            if (event['month'] > current_month or 
-                (event['month'] == current_month and event['day'] >= current_day)):
-                
-                if event['month'] == current_month:
-                    days_until = event['day'] - current_day
-                else:
-                    # Simplified calculation
-                    days_until = (event['month'] - current_month) * 30 + event['day'] - current_day
-                    
-                return event['name'], days_until
+        # Simplified calculation with 30-day months
+        today_doy = (current_month - 1) * 30 + current_day
+        i = _bisect_left(self._event_doy, today_doy)
+        if i < len(self._event_doy):
+            return self._event_names[i], self._event_doy[i] - today_doy
                 
         # Next year's first event
-        first_event = self.islamic_events[0]
-        days_until = (12 - current_month + first_event['month']) * 30 + first_event['day'] - current_day
-        return first_event['name'], days_until
+        return self._event_names[0], 360 + self._event_doy[0] - today_doy
         
     def update(self):
         """Update Prayer Times app"""
+        # One RTC read shared by everything drawn this frame
+        self._now_dt = self.rtc.datetime()
+        
+        now = time.ticks_ms()
+        refresh_due = time.ticks_diff(now, self._next_refresh) >= 0
+        if refresh_due:
+            self._next_refresh = time.ticks_add(now, 5000)
+            
         if self.view_mode == "main":
             # Update prayer times periodically
             self.update_prayer_times()
             
+            # Keep the clock and countdown current
+            if refresh_due:
+                self.draw_main_view_partial()
+            
             if self.buttons.is_pressed('A'):
                 self.view_mode = "settings"
                 self.selected_option = 0
                 self.draw_screen()
-                time.sleep_ms(200)
             elif self.buttons.is_pressed('Y'):
                 self.view_mode = "hijri"
                 self.draw_screen()
-                time.sleep_ms(200)
                 
         elif self.view_mode == "settings":
             direction = self.joystick.get_direction_slow()
@@ -498,18 +600,24 @@ class Prayers:
                         self.base_timezone = timezones[(current_idx + 1) % len(timezones)]
                     else:
                         self.base_timezone = -5  # Default to EST
+                    self._tz_cache_hour = -1
                 elif self.selected_option == 3:  # Auto DST
                     self.dst_enabled = not self.dst_enabled
+                    self._tz_cache_hour = -1
                 elif self.selected_option == 5:  # Update
+                    self._update_lat_cache()  # Pick up any location change
                     self.last_update_day = -1  # Force update
                     self.update_prayer_times()
                     
+                # Drop cached strings; the clock line depends on the timezone settings
+                self._str_cache = {}
+                self._clock_cache = None
+                    
                 self.draw_screen()
-                time.sleep_ms(200)
                 
         elif self.view_mode == "hijri":
             # Auto-refresh these views
-            if time.ticks_ms() % 5000 == 0:
+            if refresh_due:
                 self.draw_screen()
                 
         # Check for exit
@@ -519,7 +627,6 @@ class Prayers:
             else:
                 self.view_mode = "main"
                 self.draw_screen()
-                time.sleep_ms(200)
                 
         return True
         
@@ -8,6 +8,27 @@ import math
 import time
 from lib.st7789 import Color
 
+# Kaaba coordinates (Mecca, Saudi Arabia), in radians
+_KAABA_LAT = math.radians(21.4225)
+_KAABA_LON = math.radians(39.8262)
+_SIN_KAABA_LAT = math.sin(_KAABA_LAT)
+_COS_KAABA_LAT = math.cos(_KAABA_LAT)
+_EARTH_RADIUS_KM = 6371
+
+# Compass geometry
+_CX, _CY = 120, 120
+_RADIUS = 60
+
+# Labels that never change between frames, as (text, x, y, color)
+_STATIC_TEXT = (
+    ("QIBLA COMPASS", 65, 10, Color.CYAN),
+    ("N", _CX - 4, _CY - _RADIUS - 15, Color.WHITE),
+    ("S", _CX - 4, _CY + _RADIUS + 5, Color.WHITE),
+    ("E", _CX + _RADIUS + 5, _CY - 4, Color.WHITE),
+    ("W", _CX - _RADIUS - 15, _CY - 4, Color.WHITE),
+    ("A:Refresh B:Back", 60, 5, Color.GRAY),
+)
+
 class QiblaCompass:
     def __init__(self, display, joystick, buttons):
         """Initialize Qibla Compass app"""
@@ -23,6 +44,10 @@ class QiblaCompass:
         # Load location from settings if available
         self.load_location()
         
+        # Auto-refresh deadline and the location last drawn
+        self._next_refresh = time.ticks_add(time.ticks_ms(), 5000)
+        self._drawn_location = None
+        
     def load_location(self):
         """Load location from settings file"""
         try:
@@ -36,80 +61,73 @@ class QiblaCompass:
             # Use default location if settings unavailable
             pass
             
-    def init(self):
-        """Initialize app"""
-        self.draw_screen()
-        
-    def draw_screen(self):
-        """Draw Qibla compass screen"""
-        self.display.fill(Color.BLACK)
-        
-        # Title
-        self.display.text("QIBLA COMPASS", 65, 10, Color.CYAN)
-        
-        # Calculate Qibla direction
-        qibla_bearing = self.calculate_qibla_direction()
+        self._recompute_qibla()
         
-        # Draw compass
-        center_x, center_y = 120, 120
-        radius = 60
+    def _recompute_qibla(self):
+        """Cache bearing, distance and arrow direction for the current location"""
+        self._qibla_bearing = self.calculate_qibla_direction()
         
-        # Compass circle
-        self.display.circle(center_x, center_y, radius, Color.WHITE)
-        self.display.circle(center_x, center_y, radius - 2, Color.WHITE)
-        
-        # Cardinal directions
-        self.display.text("N", center_x - 4, center_y - radius - 15, Color.WHITE)
-        self.display.text("S", center_x - 4, center_y + radius + 5, Color.WHITE)
-        self.display.text("E", center_x + radius + 5, center_y - 4, Color.WHITE)
-        self.display.text("W", center_x - radius - 15, center_y - 4, Color.WHITE)
-        
-        # Qibla direction arrow
-        qibla_rad = math.radians(qibla_bearing - 90)  # -90 to start from north
-        arrow_length = radius - 10
-        
-        # Arrow tip
-        tip_x = center_x + int(arrow_length * math.cos(qibla_rad))
-        tip_y = center_y + int(arrow_length * math.sin(qibla_rad))
+        # Great-circle distance by the law of cosines, clamped for rounding near Mecca
+        lat1 = math.radians(self.latitude)
+        dlon = _KAABA_LON - math.radians(self.longitude)
+        cos_c = math.sin(lat1) * _SIN_KAABA_LAT + math.cos(lat1) * _COS_KAABA_LAT * math.cos(dlon)
+        self._kaaba_km = _EARTH_RADIUS_KM * math.acos(max(-1, min(1, cos_c)))
         
-        # Draw arrow shaft
-        self.display.line(center_x, center_y, tip_x, tip_y, Color.GREEN)
+        # Arrow endpoints, -90 to start from north
+        qibla_rad = math.radians(self._qibla_bearing - 90)
+        arrow_length = _RADIUS - 10
+        tip_x = _CX + int(arrow_length * math.cos(qibla_rad))
+        tip_y = _CY + int(arrow_length * math.sin(qibla_rad))
+        self._tip = (tip_x, tip_y)
         
         # Arrow head (simple triangular shape)
         head_length = 8
         head_angle = 0.5
+        self._head1 = (tip_x - int(head_length * math.cos(qibla_rad - head_angle)),
+                       tip_y - int(head_length * math.sin(qibla_rad - head_angle)))
+        self._head2 = (tip_x - int(head_length * math.cos(qibla_rad + head_angle)),
+                       tip_y - int(head_length * math.sin(qibla_rad + head_angle)))
+        
+        # Location-dependent labels, centered once here rather than every frame
+        bearing_text = f"Qibla: {self._qibla_bearing:.0f}°"
+        dist_text = f"Distance: {self._kaaba_km:.0f} km"
+        loc_text = f"From: {self.latitude:.1f}, {self.longitude:.1f}"
+        self._info_text = (
+            (bearing_text, (240 - len(bearing_text) * 8) // 2, 200, Color.YELLOW),
+            (dist_text, (240 - len(dist_text) * 8) // 2, 215, Color.GRAY),
+            (loc_text, (240 - len(loc_text) * 8) // 2, 30, Color.GRAY),
+        )
+            
+    def init(self):
+        """Initialize app"""
+        self.draw_screen()
         
-        head1_x = tip_x - int(head_length * math.cos(qibla_rad - head_angle))
-        head1_y = tip_y - int(head_length * math.sin(qibla_rad - head_angle))
-        head2_x = tip_x - int(head_length * math.cos(qibla_rad + head_angle))
-        head2_y = tip_y - int(head_length * math.sin(qibla_rad + head_angle))
-        
-        self.display.line(tip_x, tip_y, head1_x, head1_y, Color.GREEN)
-        self.display.line(tip_x, tip_y, head2_x, head2_y, Color.GREEN)
+    def draw_screen(self):
+        """Draw Qibla compass screen"""
+        display = self.display
+        display.fill(Color.BLACK)
+        
+        # Static layer: compass ring and fixed labels
+        display.circle(_CX, _CY, _RADIUS, Color.WHITE)
+        display.circle(_CX, _CY, _RADIUS - 2, Color.WHITE)
+        for text, x, y, color in _STATIC_TEXT:
+            display.text(text, x, y, color)
+            
+        # Qibla direction arrow, endpoints cached per location
+        tip_x, tip_y = self._tip
+        display.line(_CX, _CY, tip_x, tip_y, Color.GREEN)
+        display.line(tip_x, tip_y, self._head1[0], self._head1[1], Color.GREEN)
+        display.line(tip_x, tip_y, self._head2[0], self._head2[1], Color.GREEN)
         
         # Center dot
-        self.display.fill_rect(center_x - 2, center_y - 2, 4, 4, Color.WHITE)
-        
-        # Bearing text
-        bearing_text = f"Qibla: {qibla_bearing:.0f}°"
-        bearing_x = (240 - len(bearing_text) * 8) // 2
-        self.display.text(bearing_text, bearing_x, 200, Color.YELLOW)
-        
-        # Distance to Kaaba
-        distance = self.calculate_distance_to_kaaba()
-        dist_text = f"Distance: {distance:.0f} km"
-        dist_x = (240 - len(dist_text) * 8) // 2
-        self.display.text(dist_text, dist_x, 215, Color.GRAY)
-        
-        # Location info
-        loc_text = f"From: {self.latitude:.1f}, {self.longitude:.1f}"
-        loc_x = (240 - len(loc_text) * 8) // 2
-        self.display.text(loc_text, loc_x, 30, Color.GRAY)
-        
-        # Instructions
-        self.display.text("A:Refresh B:Back", 60, 5, Color.GRAY)
+        display.fill_rect(_CX - 2, _CY - 2, 4, 4, Color.WHITE)
         
+        # Bearing, distance and location
+        for text, x, y, color in self._info_text:
+            display.text(text, x, y, color)
+            
         self.display.display()
+        self._drawn_location = (self.latitude, self.longitude)
         
     def calculate_qibla_direction(self):
         """Calculate Qibla direction from current location to Kaaba"""
@@ -134,31 +152,6 @@ class QiblaCompass:
         
         return bearing
         
-    def calculate_distance_to_kaaba(self):
-        """Calculate distance to Kaaba in kilometers using haversine formula"""
-        # Kaaba coordinates
-        kaaba_lat = 21.4225
-        kaaba_lon = 39.8262
-        
-        # Haversine formula
-        lat1 = math.radians(self.latitude)
-        lon1 = math.radians(self.longitude)
-        lat2 = math.radians(kaaba_lat)
-        lon2 = math.radians(kaaba_lon)
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth radius in kilometers
-        earth_radius = 6371
-        distance = earth_radius * c
-        
-        return distance
-        
     def update(self):
         """Update Qibla Compass app"""
         # Update button states
@@ -169,14 +162,16 @@ class QiblaCompass:
             # Refresh the display and recalculate
             self.load_location()  # Reload location in case settings changed
             self.draw_screen()
-            time.sleep_ms(200)
             
         if self.buttons.is_pressed('B'):
             return False  # Exit app
             
-        # Auto-refresh every 5 seconds to update calculations
-        if time.ticks_ms() % 5000 == 0:
-            self.draw_screen()
+        # Auto-refresh every 5 seconds, only if the location has changed
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self._next_refresh) >= 0:
+            self._next_refresh = time.ticks_add(now, 5000)
+            if (self.latitude, self.longitude) != self._drawn_location:
+                self.draw_screen()
             
         return True
         
@@ -5,10 +5,25 @@ Features progress tracking, streaks, and Morti celebrations
 """
 
 import time
-import json
-import random
+import os
 from lib.st7789 import Color
 
+# Fixed text tables for the active quest and celebration screens
+_ENCOURAGEMENTS = (
+    "You've got this! ◕‿◕",
+    "Tiny steps, big wins! ◕ᴗ◕",
+    "Focus energy building... ◕◡◕",
+    "Small quest, huge impact! ◕‿◕",
+)
+_CELEBRATIONS = ("★ QUEST COMPLETE! ★", "✧ QUEST COMPLETE! ✧", "◆ QUEST COMPLETE! ◆", "♦ QUEST COMPLETE! ♦")
+_MORTI_FRAMES = ("◕‿◕", "◕ᴗ◕", "◕◡◕", "◕‿◕", "ᕕ( ◕‿◕ )ᕗ")
+
+# All celebration header variants are 19 characters wide
+_CELEBRATION_X = (240 - 19 * 8) // 2
+
+# Morti lines with their centered x
+_MORTI_LINES = tuple((t, (240 - len(t) * 8) // 2) for t in ("Morti says: " + f for f in _MORTI_FRAMES))
+
 class QuestBits:
     def __init__(self, display, joystick, buttons):
         """Initialize QuestBits app"""
@@ -24,6 +39,29 @@ class QuestBits:
         self.morti_animation_frame = 0
         self.celebration_timer = 0
 
+        # Today's date string, re-read from the clock at most once a minute
+        self._cached_date_str = ''
+        self._cached_date_epoch = 0
+        self._cached_date_tick = time.ticks_add(time.ticks_ms(), -60000)
+
+        # Progress changes not yet written to flash
+        self._dirty = False
+
+        # Last active-quest timer refresh
+        self._last_tick = time.ticks_ms()
+
+        # Whether the framebuffer has changes not yet sent to the display
+        self._frame_dirty = False
+        self._drawn_elapsed = -1
+
+        # Non-blocking button cooldown deadline
+        self._btn_cooldown_until = time.ticks_ms()
+
+        # Cursor moved since the last home redraw, and when it may redraw next
+        self._nav_dirty = False
+        self._nav_redraw_at = time.ticks_ms()
+        self._drawn_selected = 0
+
         # Quest content packs
         self.quest_packs = {
             "Focus": {
@@ -88,68 +126,184 @@ class QuestBits:
             }
         }
 
+        # Pack fields as parallel tuples indexed by pack number, fixed after init
+        self._pack_names = tuple(self.quest_packs)
+        self._pack_colors = tuple(self.quest_packs[n]["color"] for n in self._pack_names)
+        self._pack_icons = tuple(self.quest_packs[n]["icon"] for n in self._pack_names)
+        self._pack_quests = tuple(self.quest_packs[n]["quests"] for n in self._pack_names)
+        self._pack_lens = tuple(len(q) for q in self._pack_quests)
+
+        # Random bits needed to cover each pack's quest count
+        pack_bits = []
+        for n in self._pack_lens:
+            bits = 1
+            while (1 << bits) < n:
+                bits += 1
+            pack_bits.append(bits)
+        self._pack_bits = tuple(pack_bits)
+
+        # Static home-screen labels per pack: (icon and name, preview)
+        self._home_static = [(f"{icon} {name}", name.lower()[:6])
+                             for name, icon in zip(self._pack_names, self._pack_icons)]
+
+        # Active quest title per pack with its centered x
+        self._quest_title = []
+        for name, icon in zip(self._pack_names, self._pack_icons):
+            title = f"{icon} {name} Quest"
+            self._quest_title.append((title, (240 - len(title) * 8) // 2))
+
+        # Stats strings, rebuilt only after the counters change
+        self._stats_dirty = True
+        self._stats_text = None
+
         # Load progress data
         self.load_progress()
 
+    def _init_defaults(self):
+        """Reset progress to a fresh start"""
+        self.total_completed = 0
+        self.daily_streak = 0
+        self._last_quest_epoch = 0
+        self.pack_stats = {pack: 0 for pack in self._pack_names}
+        self.daily_completed = 0
+        self.last_daily_reset = ''
+
     def load_progress(self):
         """Load progress data from storage"""
+        self._init_defaults()
+
+        # Probe first so a missing file on first run doesn't raise from open()
+        try:
+            os.stat('/stores/questbits.json')
+        except OSError:
+            return
+
         try:
             with open('/stores/questbits.json', 'r') as f:
-                data = json.load(f)
+                raw = f.read()
+            if raw[:1] == '{':
+                # Legacy JSON file, rewritten in the compact format on the next save
+                import json
+                data = json.loads(raw)
                 self.total_completed = data.get('total_completed', 0)
                 self.daily_streak = data.get('daily_streak', 0)
-                self.last_quest_date = data.get('last_quest_date', '')
-                self.pack_stats = data.get('pack_stats', {pack: 0 for pack in self.quest_packs.keys()})
+                self._last_quest_epoch = self._date_epoch(data.get('last_quest_date', ''))
+                self.pack_stats = data.get('pack_stats', {})
                 self.daily_completed = data.get('daily_completed', 0)
                 self.last_daily_reset = data.get('last_daily_reset', '')
+            else:
+                # total|streak|last quest date|today|last reset|name=count,...
+                parts = raw.split('|')
+                self.total_completed = int(parts[0])
+                self.daily_streak = int(parts[1])
+                self._last_quest_epoch = self._date_epoch(parts[2])
+                self.daily_completed = int(parts[3])
+                self.last_daily_reset = parts[4]
+                self.pack_stats = {}
+                for item in parts[5].split(','):
+                    if item:
+                        name, count = item.split('=')
+                        self.pack_stats[name] = int(count)
         except:
-            # Initialize default values
-            self.total_completed = 0
-            self.daily_streak = 0
-            self.last_quest_date = ''
-            self.pack_stats = {pack: 0 for pack in self.quest_packs.keys()}
-            self.daily_completed = 0
-            self.last_daily_reset = ''
+            # Unreadable file, start fresh
+            self._init_defaults()
+
+        # Every pack has a count, so lookups can index directly
+        for name in self._pack_names:
+            self.pack_stats.setdefault(name, 0)
 
     def save_progress(self):
         """Save progress data to storage"""
         try:
-            data = {
-                'total_completed': self.total_completed,
-                'daily_streak': self.daily_streak,
-                'last_quest_date': self.last_quest_date,
-                'pack_stats': self.pack_stats,
-                'daily_completed': self.daily_completed,
-                'last_daily_reset': self.last_daily_reset
-            }
+            buf = "%d|%d|%d|%d|%s|" % (self.total_completed, self.daily_streak, self._last_quest_epoch,
+                                       self.daily_completed, self.last_daily_reset)
+            buf += ",".join("%s=%d" % kv for kv in self.pack_stats.items())
             with open('/stores/questbits.json', 'w') as f:
-                json.dump(data, f)
+                f.write(buf)
+            return True
         except:
-            pass  # Fail silently
+            return False  # Fail silently
+
+    def _flush(self):
+        """Write progress if anything changed since the last save"""
+        if self._dirty and self.save_progress():
+            self._dirty = False
+
+    def _today_str(self):
+        """Return today's date as YYYY-MM-DD, cached for up to a minute"""
+        now = time.ticks_ms()
+        if not self._cached_date_str or time.ticks_diff(now, self._cached_date_tick) >= 60000:
+            y, m, d = time.localtime()[:3]
+            self._cached_date_str = "%04d-%02d-%02d" % (y, m, d)
+            self._cached_date_epoch = time.mktime((y, m, d, 0, 0, 0, 0, 0))
+            self._cached_date_tick = now
+        return self._cached_date_str
+
+    def _today_epoch(self):
+        """Return midnight today in epoch seconds, cached with _today_str"""
+        self._today_str()
+        return self._cached_date_epoch
+
+    def _date_epoch(self, value):
+        """Midnight epoch seconds from a saved value, 0 if there is none"""
+        if not value:
+            return 0
+        if '-' in value:
+            # Older saves stored the date as YYYY-MM-DD
+            y, m, d = value.split('-')
+            return time.mktime((int(y), int(m), int(d), 0, 0, 0, 0, 0))
+        return int(value)
 
     def check_daily_reset(self):
         """Check if we need to reset daily counters"""
-        current_date = time.localtime()[:3]  # (year, month, day)
-        current_date_str = f"{current_date[0]}-{current_date[1]:02d}-{current_date[2]:02d}"
+        current_date_str = self._today_str()
 
         if self.last_daily_reset != current_date_str:
             self.daily_completed = 0
             self.last_daily_reset = current_date_str
-            self.save_progress()
+            self._dirty = True
+            self._stats_dirty = True
+
+    def _stats_strings(self):
+        """Return cached stats strings, rebuilding them if the counters changed"""
+        if self._stats_dirty or self._stats_text is None:
+            self._stats_text = {
+                "home": "Total:%d Today:%d Streak:%d" % (self.total_completed, self.daily_completed, self.daily_streak),
+                "counts": ["(%d)" % self.pack_stats[name] for name in self._pack_names],
+                "total": "Total: %d" % self.total_completed,
+                "today": "Today: %d" % self.daily_completed,
+                "streak": "Streak: %d" % self.daily_streak,
+                "total_completed": "Total Completed: %d" % self.total_completed,
+                "daily_streak": "Daily Streak: %d" % self.daily_streak,
+                "breakdown": ["%s %s: %d" % (icon, name, self.pack_stats[name])
+                              for name, icon in zip(self._pack_names, self._pack_icons)],
+            }
+            self._stats_dirty = False
+        return self._stats_text
 
-    def get_random_quest(self, pack_name):
+    def get_random_quest(self, pack_idx):
         """Get a random quest from the specified pack"""
-        quests = self.quest_packs[pack_name]["quests"]
-        return random.choice(quests)
+        import random
 
-    def start_quest(self, pack_name):
+        # Integer-only pick; redraw out-of-range values to keep it unbiased
+        n = self._pack_lens[pack_idx]
+        bits = self._pack_bits[pack_idx]
+        i = random.getrandbits(bits)
+        while i >= n:
+            i = random.getrandbits(bits)
+        return self._pack_quests[pack_idx][i]
+
+    def start_quest(self, pack_idx):
         """Start a new quest from the specified pack"""
+        text = self.get_random_quest(pack_idx)
         self.current_quest = {
-            "pack": pack_name,
-            "text": self.get_random_quest(pack_name),
+            "pack_idx": pack_idx,
+            "text": text,
+            "lines": self._wrap(text, 220, 8),  # Wrapped once per quest
             "start_time": time.ticks_ms()
         }
         self.current_screen = "quest_active"
+        self._last_tick = self.current_quest["start_time"]
 
     def complete_quest(self):
         """Mark current quest as completed and update stats"""
@@ -159,28 +313,27 @@ class QuestBits:
         # Update statistics
         self.total_completed += 1
         self.daily_completed += 1
-        pack_name = self.current_quest["pack"]
-        self.pack_stats[pack_name] = self.pack_stats.get(pack_name, 0) + 1
+        pack_name = self._pack_names[self.current_quest["pack_idx"]]
+        self.pack_stats[pack_name] += 1
 
-        # Update streak
-        current_date = time.localtime()[:3]
-        current_date_str = f"{current_date[0]}-{current_date[1]:02d}-{current_date[2]:02d}"
+        # Update streak: continues the day after the last quest, restarts after a gap
+        today = self._today_epoch()
+        delta = today - self._last_quest_epoch
 
-        if self.last_quest_date == current_date_str:
+        if delta == 0:
             # Same day, don't update streak
             pass
-        elif self.last_quest_date == "":
-            # First quest ever
-            self.daily_streak = 1
-        else:
-            # Check if it's consecutive day
-            # For simplicity, just increment (would need proper date math for real consecutive checking)
+        elif delta == 86400:
             self.daily_streak += 1
+        else:
+            # First quest ever or a missed day
+            self.daily_streak = 1
 
-        self.last_quest_date = current_date_str
+        self._last_quest_epoch = today
 
-        # Save progress
-        self.save_progress()
+        # Saved on the way back home or on exit
+        self._dirty = True
+        self._stats_dirty = True
 
         # Switch to celebration screen
         self.current_screen = "completed"
@@ -189,108 +342,136 @@ class QuestBits:
 
     def init(self):
         """Initialize app"""
+        # The boot-time deadline reads as future once ticks pass 2^29
+        self._btn_cooldown_until = time.ticks_ms()
         self.check_daily_reset()
         self.draw_screen()
 
     def draw_home_screen(self):
         """Draw the home screen with quest pack selection"""
+        self._mark_dirty()
+        self._nav_dirty = False
         self.display.fill(Color.BLACK)
 
         # Title
         self.display.text("QUESTBITS", 80, 5, Color.CYAN)
 
         # Stats line
-        stats_text = f"Total:{self.total_completed} Today:{self.daily_completed} Streak:{self.daily_streak}"
-        self.display.text(stats_text, 5, 20, Color.GRAY)
+        stats = self._stats_strings()
+        self.display.text(stats["home"], 5, 20, Color.GRAY)
 
         # Quest packs
-        pack_names = list(self.quest_packs.keys())
-        y_start = 45
-
-        for i, pack_name in enumerate(pack_names):
-            pack_info = self.quest_packs[pack_name]
-            y = y_start + i * 35
-
-            # Highlight selected pack
-            if i == self.selected_pack:
-                self.display.fill_rect(5, y - 5, 230, 30, Color.WHITE)
-                text_color = Color.BLACK
-                bg_color = Color.WHITE
-            else:
-                text_color = pack_info["color"]
-                bg_color = Color.BLACK
+        for i in range(len(self._home_static)):
+            self._draw_pack_row(i, i == self.selected_pack, False)
+        self._drawn_selected = self.selected_pack
+
+        # Instructions
+        self.display.text("↑↓:Select A:Start B:Stats", 20, 220, Color.GRAY)
 
-            # Pack icon and name
-            icon_text = f"{pack_info['icon']} {pack_name}"
-            self.display.text(icon_text, 10, y, text_color)
+    def _draw_pack_row(self, i, selected, clear=True):
+        """Draw one pack row of the home screen"""
+        icon_text, preview = self._home_static[i]
+        y = 45 + i * 35
 
-            # Pack completion count
-            completed = self.pack_stats.get(pack_name, 0)
-            count_text = f"({completed})"
-            count_x = 180
-            self.display.text(count_text, count_x, y, text_color)
+        # Highlight selected pack
+        if selected:
+            self.display.fill_rect(5, y - 5, 230, 30, Color.WHITE)
+            text_color = Color.BLACK
+        else:
+            if clear:
+                self.display.fill_rect(5, y - 5, 230, 30, Color.BLACK)
+            text_color = self._pack_colors[i]
 
-            # Quick preview of quest type
-            preview = pack_name.lower()[:6]
-            self.display.text(preview, 10, y + 12, Color.GRAY if i != self.selected_pack else Color.DARK_GRAY)
+        # Pack icon and name
+        self.display.text(icon_text, 10, y, text_color)
 
-        # Instructions
-        self.display.text("↑↓:Select A:Start B:Stats", 20, 220, Color.GRAY)
+        # Pack completion count
+        self.display.text(self._stats_strings()["counts"][i], 180, y, text_color)
+
+        # Quick preview of quest type
+        self.display.text(preview, 10, y + 12, Color.DARK_GRAY if selected else Color.GRAY)
+
+    def _move_highlight(self):
+        """Redraw only the rows whose highlight changed"""
+        self._nav_dirty = False
+        if self._drawn_selected != self.selected_pack:
+            self._mark_dirty()
+            self._draw_pack_row(self._drawn_selected, False)
+            self._draw_pack_row(self.selected_pack, True)
+            self._drawn_selected = self.selected_pack
+        self._present()
 
     def draw_quest_active_screen(self):
         """Draw the active quest screen"""
+        self._mark_dirty()
         self.display.fill(Color.BLACK)
 
         if not self.current_quest:
             return
 
-        pack_name = self.current_quest["pack"]
-        pack_info = self.quest_packs[pack_name]
+        pack_idx = self.current_quest["pack_idx"]
 
         # Title with pack indicator
-        title = f"{pack_info['icon']} {pack_name} Quest"
-        title_x = (240 - len(title) * 8) // 2
-        self.display.text(title, title_x, 5, pack_info["color"])
+        title, title_x = self._quest_title[pack_idx]
+        self.display.text(title, title_x, 5, self._pack_colors[pack_idx])
+
+        # Quest text, wrapped when the quest started
+        self.draw_lines(self.current_quest["lines"], 10, 30, Color.WHITE)
+
+        # Timer and encouragement
+        self._draw_timer()
 
-        # Quest text (word wrap)
-        quest_text = self.current_quest["text"]
-        self.draw_wrapped_text(quest_text, 10, 30, 220, Color.WHITE)
+        # Instructions
+        self.display.text("A:Complete B:Cancel", 50, 220, Color.GRAY)
 
-        # Timer
-        elapsed = (time.ticks_ms() - self.current_quest["start_time"]) // 1000
+    def _quest_elapsed(self):
+        """Whole seconds since the current quest started"""
+        return time.ticks_diff(time.ticks_ms(), self.current_quest["start_time"]) // 1000
+
+    def _draw_timer(self):
+        """Draw the elapsed time and encouragement lines of the active quest"""
+        elapsed = self._quest_elapsed()
+        self._drawn_elapsed = elapsed
         timer_text = f"Time: {elapsed}s"
         self.display.text(timer_text, 10, 140, Color.YELLOW)
 
         # Morti encouragement
-        encouragements = [
-            "You've got this! ◕‿◕",
-            "Tiny steps, big wins! ◕ᴗ◕",
-            "Focus energy building... ◕◡◕",
-            "Small quest, huge impact! ◕‿◕"
-        ]
-        encouragement = encouragements[elapsed % len(encouragements)]
+        encouragement = _ENCOURAGEMENTS[elapsed % len(_ENCOURAGEMENTS)]
         self.display.text(encouragement, 10, 160, Color.GREEN)
 
-        # Instructions
-        self.display.text("A:Complete B:Cancel", 50, 220, Color.GRAY)
+    def _redraw_timer(self):
+        """Refresh only the timer and encouragement lines"""
+        if self._quest_elapsed() == self._drawn_elapsed:
+            return  # Same second, nothing to redraw
+
+        self._mark_dirty()
+        self.display.fill_rect(10, 140, 230, 30, Color.BLACK)
+        self._draw_timer()
+        self._present()
+
+    def _mark_dirty(self):
+        """Note that the framebuffer changed since the last flush"""
+        self._frame_dirty = True
+
+    def _present(self):
+        """Send the framebuffer to the display if anything was drawn"""
+        if self._frame_dirty:
+            self.display.display()
+            self._frame_dirty = False
 
     def draw_completed_screen(self):
         """Draw quest completion celebration screen"""
+        self._mark_dirty()
         self.display.fill(Color.BLACK)
 
         # Animated celebration header
         if time.ticks_ms() - self.celebration_timer < 3000:  # 3 second celebration
-            frame = (time.ticks_ms() // 200) % 4
-            celebrations = ["★ QUEST COMPLETE! ★", "✧ QUEST COMPLETE! ✧", "◆ QUEST COMPLETE! ◆", "♦ QUEST COMPLETE! ♦"]
-            celebration_text = celebrations[frame]
-            text_x = (240 - len(celebration_text) * 8) // 2
-            self.display.text(celebration_text, text_x, 20, Color.YELLOW)
+            # Header cycles through 4 variants, Morti through all 5 frames
+            tick = time.ticks_ms() // 200
+            self.display.text(_CELEBRATIONS[tick & 3], _CELEBRATION_X, 20, Color.YELLOW)
 
             # Morti celebration animation
-            morti_frames = ["◕‿◕", "◕ᴗ◕", "◕◡◕", "◕‿◕", "ᕕ( ◕‿◕ )ᕗ"]
-            morti_frame = morti_frames[frame % len(morti_frames)]
-            morti_text = f"Morti says: {morti_frame}"
-            morti_x = (240 - len(morti_text) * 8) // 2
+            morti_text, morti_x = _MORTI_LINES[tick % 5]
             self.display.text(morti_text, morti_x, 50, Color.GREEN)
         else:
             # Static completion message
@@ -303,24 +484,23 @@ class QuestBits:
         self.display.text("• +1 Daily Progress", 15, 110, Color.WHITE)
 
         if self.current_quest:
-            pack_name = self.current_quest["pack"]
+            pack_name = self._pack_names[self.current_quest["pack_idx"]]
             reward_text = f"• +1 {pack_name} XP"
             self.display.text(reward_text, 15, 125, Color.WHITE)
 
         # Updated stats
         self.display.text("Updated Stats:", 10, 150, Color.CYAN)
-        stats_text = f"Total: {self.total_completed}"
-        self.display.text(stats_text, 15, 165, Color.WHITE)
-        daily_text = f"Today: {self.daily_completed}"
-        self.display.text(daily_text, 15, 180, Color.WHITE)
-        streak_text = f"Streak: {self.daily_streak}"
-        self.display.text(streak_text, 15, 195, Color.WHITE)
+        stats = self._stats_strings()
+        self.display.text(stats["total"], 15, 165, Color.WHITE)
+        self.display.text(stats["today"], 15, 180, Color.WHITE)
+        self.display.text(stats["streak"], 15, 195, Color.WHITE)
 
         # Instructions
         self.display.text("A:Another Quest B:Home", 40, 220, Color.GRAY)
 
     def draw_stats_screen(self):
         """Draw detailed statistics screen"""
+        self._mark_dirty()
         self.display.fill(Color.BLACK)
 
         # Title
@@ -328,42 +508,48 @@ class QuestBits:
 
         # Overall stats
         self.display.text("Overall Progress:", 10, 25, Color.YELLOW)
-        self.display.text(f"Total Completed: {self.total_completed}", 15, 40, Color.WHITE)
-        self.display.text(f"Daily Streak: {self.daily_streak}", 15, 55, Color.WHITE)
-        self.display.text(f"Today: {self.daily_completed}", 15, 70, Color.WHITE)
+        stats = self._stats_strings()
+        self.display.text(stats["total_completed"], 15, 40, Color.WHITE)
+        self.display.text(stats["daily_streak"], 15, 55, Color.WHITE)
+        self.display.text(stats["today"], 15, 70, Color.WHITE)
 
         # Pack breakdown
         self.display.text("Pack Breakdown:", 10, 95, Color.YELLOW)
         y = 110
-        for pack_name, count in self.pack_stats.items():
-            pack_color = self.quest_packs[pack_name]["color"]
-            icon = self.quest_packs[pack_name]["icon"]
-            text = f"{icon} {pack_name}: {count}"
-            self.display.text(text, 15, y, pack_color)
+        for i, text in enumerate(stats["breakdown"]):
+            self.display.text(text, 15, y, self._pack_colors[i])
             y += 15
 
         # Instructions
         self.display.text("B:Back to Home", 60, 220, Color.GRAY)
 
-    def draw_wrapped_text(self, text, x, y, max_width, color):
-        """Draw text with word wrapping"""
-        words = text.split(' ')
-        line = ''
-        line_y = y
-        char_width = 8  # Approximate character width
-
-        for word in words:
-            test_line = line + word + ' '
-            if len(test_line) * char_width <= max_width:
-                line = test_line
+    def _wrap(self, text, max_width, char_width):
+        """Split text into lines that fit max_width pixels"""
+        max_cols = max_width // char_width
+        lines = []
+
+        # Count columns per word and only join a line once it is full
+        cols = 0
+        parts = []
+        for word in text.split(' '):
+            word_cols = len(word) + 1
+            if cols + word_cols > max_cols and parts:
+                lines.append(' '.join(parts))
+                parts = [word]
+                cols = word_cols
             else:
-                if line:
-                    self.display.text(line.strip(), x, line_y, color)
-                    line_y += 15
-                line = word + ' '
+                parts.append(word)
+                cols += word_cols
 
-        if line:
-            self.display.text(line.strip(), x, line_y, color)
+        if parts:
+            lines.append(' '.join(parts))
+        return lines
+
+    def draw_lines(self, lines, x, y, color):
+        """Draw pre-wrapped lines"""
+        for line in lines:
+            self.display.text(line, x, y, color)
+            y += 15
 
     def draw_screen(self):
         """Draw the current screen"""
@@ -376,82 +562,102 @@ class QuestBits:
         elif self.current_screen == "stats":
             self.draw_stats_screen()
 
-        self.display.display()
-
-    def update(self):
-        """Update QuestBits app"""
-        self.buttons.update()
-
+        self._present()
+
+    def _cooldown(self, ms):
+        """Ignore button presses for the next ms milliseconds"""
+        self._btn_cooldown_until = time.ticks_add(time.ticks_ms(), ms)
+
+    def handle_navigation(self):
+        """Move the home cursor, redrawing at most once per 50 ms"""
+        direction = self.joystick.get_direction_medium()
+        if direction == 'UP':
+            self.selected_pack = (self.selected_pack - 1) % len(self._pack_names)
+            self._nav_dirty = True
+        elif direction == 'DOWN':
+            self.selected_pack = (self.selected_pack + 1) % len(self._pack_names)
+            self._nav_dirty = True
+
+        # Steps taken since the last redraw are drawn together
+        now = time.ticks_ms()
+        if self._nav_dirty and time.ticks_diff(now, self._nav_redraw_at) >= 0:
+            self._move_highlight()
+            self._nav_redraw_at = time.ticks_add(now, 50)
+
+    def handle_input(self):
+        """Handle button presses for the current screen"""
         if self.current_screen == "home":
-            # Navigation
-            if self.buttons.is_pressed('UP'):
-                self.selected_pack = (self.selected_pack - 1) % len(self.quest_packs)
-                self.draw_screen()
-                time.sleep_ms(150)
-
-            elif self.buttons.is_pressed('DOWN'):
-                self.selected_pack = (self.selected_pack + 1) % len(self.quest_packs)
-                self.draw_screen()
-                time.sleep_ms(150)
-
-            elif self.buttons.is_pressed('A'):
+            if self.buttons.is_pressed('A'):
                 # Start quest from selected pack
-                pack_names = list(self.quest_packs.keys())
-                selected_pack_name = pack_names[self.selected_pack]
-                self.start_quest(selected_pack_name)
+                self.start_quest(self.selected_pack)
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
             elif self.buttons.is_pressed('B'):
                 # Show stats
                 self.current_screen = "stats"
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
         elif self.current_screen == "quest_active":
             if self.buttons.is_pressed('A'):
                 # Complete quest
                 self.complete_quest()
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
             elif self.buttons.is_pressed('B'):
                 # Cancel quest
                 self.current_quest = None
                 self.current_screen = "home"
+                self._flush()
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
         elif self.current_screen == "completed":
             if self.buttons.is_pressed('A'):
                 # Start another quest (same pack)
                 if self.current_quest:
-                    pack_name = self.current_quest["pack"]
-                    self.start_quest(pack_name)
+                    self.start_quest(self.current_quest["pack_idx"])
                     self.draw_screen()
-                    time.sleep_ms(200)
+                    self._cooldown(200)
 
             elif self.buttons.is_pressed('B'):
                 # Return to home
                 self.current_quest = None
                 self.current_screen = "home"
+                self._flush()
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
         elif self.current_screen == "stats":
             if self.buttons.is_pressed('B'):
                 # Return to home
                 self.current_screen = "home"
+                self._flush()
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
-        # Auto-refresh active quest screen every second
+    def update(self):
+        """Update QuestBits app"""
+        self.buttons.update()
+
+        if self.current_screen == "home":
+            self.handle_navigation()
+
+        # Buttons are ignored until the previous press's cooldown runs out
+        if time.ticks_diff(time.ticks_ms(), self._btn_cooldown_until) >= 0:
+            self.handle_input()
+
+        # Refresh the active quest timer every second
         if self.current_screen == "quest_active":
-            if time.ticks_ms() % 1000 < 50:  # Refresh roughly every second
-                self.draw_screen()
+            now = time.ticks_ms()
+            if time.ticks_diff(now, self._last_tick) >= 1000:
+                self._last_tick = now
+                self._redraw_timer()
 
         return True
 
     def cleanup(self):
         """Cleanup when exiting app"""
-        self.save_progress()
\ No newline at end of file
+        self._flush()
\ No newline at end of file
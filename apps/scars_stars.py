@@ -7,9 +7,29 @@ Turning tough moments (scars) and bright ones (stars) into constellation growth
 import time
 import json
 import math
-import random
+from array import array
 from lib.st7789 import Color
 
+# Home menu labels and control hints, normal and stealth
+_MENU_ITEMS = ("Quick Log (30s)", "Deep Log (2min)", "Repair Ritual", "Constellation", "Values & Anchors")
+_MENU_ITEMS_STEALTH = ("Log", "Deep", "Repair", "View", "Values")
+_CONTROLS = "↑↓:Select A:Enter B:Exit Y:Stealth"
+_CONTROLS_STEALTH = "↑↓ A:Go B:Exit Y:Exit Stealth"
+
+# Log titles with step indicator, indexed by log_step
+_QUICK_LOG_TITLES = ("QUICK LOG ●○○", "QUICK LOG ●●○", "QUICK LOG ●●●")
+_DEEP_LOG_TITLES = ("DEEP LOG ●○○○○", "DEEP LOG ●●○○○", "DEEP LOG ●●●○○", "DEEP LOG ●●●●○", "DEEP LOG ●●●●●")
+
+_VIBES = (("⭐ Star (positive)", 1), ("✚ Scar (challenging)", -1))
+_NOTE_OPTIONS = (
+    "felt overwhelmed", "they really got it", "miscommunication",
+    "felt supported", "boundary crossed", "great connection"
+)
+
+# Sine and cosine per whole degree for constellation placement
+_SIN = array('f', [math.sin(i * math.pi / 180) for i in range(360)])
+_COS = array('f', [math.cos(i * math.pi / 180) for i in range(360)])
+
 class ScarsStars:
     def __init__(self, display, joystick, buttons):
         """Initialize Scars & Stars app"""
@@ -29,6 +49,7 @@ class ScarsStars:
         # UI state
         self.animation_frame = 0
         self.constellation_cursor = {"x": 120, "y": 120}
+        self._cooldown_until = 0  # Input ignored until this tick, seeded in init()
 
         # Data
         self.people = []
@@ -59,12 +80,17 @@ class ScarsStars:
 
     def load_data(self):
         """Load all data from storage"""
+        # Which stores have changed since they were last written
+        self._dirty = {"people": False, "entries": False, "repair": False}
+
         # Load people
         try:
             with open('/stores/people.json', 'r') as f:
                 self.people = json.load(f)
         except:
             self.people = [{"id": "anon", "name": "Someone", "glyph": "?"}]
+            self._dirty["people"] = True
+        self._pid_index = {p["id"]: i for i, p in enumerate(self.people)}
 
         # Load entries and values
         try:
@@ -75,6 +101,12 @@ class ScarsStars:
         except:
             self.entries = []
 
+        # Values reminder only changes on load
+        values_text = " • ".join(self.values)
+        if len(values_text) * 8 > 220:
+            values_text = values_text[:25] + "..."
+        self._values_text = values_text
+
         # Load repair queue
         try:
             with open('/stores/repair_queue.json', 'r') as f:
@@ -82,27 +114,83 @@ class ScarsStars:
         except:
             self.repair_queue = []
 
+        self._recount()
+
+    def _recount(self):
+        """Recompute home screen counts and the repair index in a single pass over entries and repairs"""
+        stars = 0
+        for e in self.entries:
+            if e["valence"] > 0:
+                stars += 1
+        self.star_count = stars
+        self.scar_count = len(self.entries) - stars
+
+        # Repairs grouped by the entry they belong to, so healing scores
+        # don't rescan the whole queue for every scar
+        unresolved = 0
+        by_eid = {}
+        for r in self.repair_queue:
+            if r["status"] != "completed":
+                unresolved += 1
+            eid = r.get("eid")
+            if eid in by_eid:
+                by_eid[eid].append(r)
+            else:
+                by_eid[eid] = [r]
+        self.unresolved_count = unresolved
+        self._repairs_by_eid = by_eid
+
+        # Scars still needing repair and the stats line, rebuilt lazily
+        self._unresolved_scars = None
+        self._stats_text = None
+
+    def get_unresolved_scars(self):
+        """Get scars that still need healing, cached until entries or repairs change"""
+        if self._unresolved_scars is None:
+            self._unresolved_scars = [e for e in self.entries if e["valence"] < 0 and self.calculate_healing_score(e) > 0]
+        return self._unresolved_scars
+
     def save_data(self):
-        """Save all data to storage"""
-        # Save people
+        """Save changed data to storage"""
+        self.save_people()
+        self.save_entries()
+        self.save_repair_queue()
+
+    # Each store is serialized up front so it reaches flash in one write,
+    # and skipped entirely when unchanged since it was last written
+    def save_people(self):
+        """Save people list if changed"""
+        if not self._dirty["people"]:
+            return
         try:
             with open('/stores/people.json', 'w') as f:
-                json.dump(self.people, f)
+                f.write(json.dumps(self.people))
+            self._dirty["people"] = False
         except:
             pass
 
-        # Save entries and values
+    def save_entries(self):
+        """Save entries and values if changed"""
+        if not self._dirty["entries"]:
+            return
         try:
-            data = {"values": self.values, "entries": self.entries}
+            # Leave out cached constellation positions
+            entries = [{k: v for k, v in e.items() if k != "_x" and k != "_y"} for e in self.entries]
+            data = {"values": self.values, "entries": entries}
             with open('/stores/scars_stars.json', 'w') as f:
-                json.dump(data, f)
+                f.write(json.dumps(data))
+            self._dirty["entries"] = False
         except:
             pass
 
-        # Save repair queue
+    def save_repair_queue(self):
+        """Save repair queue if changed"""
+        if not self._dirty["repair"]:
+            return
         try:
             with open('/stores/repair_queue.json', 'w') as f:
-                json.dump(self.repair_queue, f)
+                f.write(json.dumps(self.repair_queue))
+            self._dirty["repair"] = False
         except:
             pass
 
@@ -143,9 +231,16 @@ class ScarsStars:
 
         # Add to entries
         self.entries.append(self.current_log.copy())
+        if self.current_log["valence"] > 0:
+            self.star_count += 1
+        else:
+            self.scar_count += 1
+        self._unresolved_scars = None
+        self._stats_text = None
+        self._dirty["entries"] = True
 
-        # Save data
-        self.save_data()
+        # Save data, only the entries file has changed
+        self.save_entries()
 
         # Show completion feedback
         self.show_log_completion()
@@ -189,86 +284,120 @@ class ScarsStars:
         else:
             self.display.text("SCARS & STARS", 65, 5, Color.CYAN)
 
-        # Quick stats
-        star_count = len([e for e in self.entries if e["valence"] > 0])
-        scar_count = len([e for e in self.entries if e["valence"] <= 0])
-        unresolved = len([r for r in self.repair_queue if r["status"] != "completed"])
-
-        stats_text = f"⭐{star_count} ✚{scar_count}"
-        if unresolved > 0 and not self.stealth_mode:
-            stats_text += f" ⚠{unresolved}"
-        self.display.text(stats_text, 10, 25, Color.GRAY)
+        # Quick stats, rebuilt only when a count or stealth mode changes
+        if self._stats_text is None:
+            stats_text = f"⭐{self.star_count} ✚{self.scar_count}"
+            if self.unresolved_count > 0 and not self.stealth_mode:
+                stats_text += f" ⚠{self.unresolved_count}"
+            self._stats_text = stats_text
+        self.display.text(self._stats_text, 10, 25, Color.GRAY)
 
         # Menu options
-        menu_items = [
-            "Quick Log (30s)",
-            "Deep Log (2min)",
-            "Repair Ritual",
-            "Constellation",
-            "Values & Anchors"
-        ]
-
-        if self.stealth_mode:
-            menu_items = ["Log", "Deep", "Repair", "View", "Values"]
-
-        y_start = 50
-        for i, item in enumerate(menu_items):
-            y = y_start + i * 25
-
-            if i == self.selected_index:
-                self.display.fill_rect(5, y - 5, 230, 20, Color.WHITE)
-                text_color = Color.BLACK
-            else:
-                text_color = Color.WHITE
-
-            self.display.text(item, 10, y, text_color)
+        self._draw_rows()
 
         # Values reminder
         if not self.stealth_mode:
-            values_text = " • ".join(self.values)
-            if len(values_text) * 8 > 220:
-                values_text = values_text[:25] + "..."
-            self.display.text(values_text, 10, 190, Color.PURPLE)
+            self.display.text(self._values_text, 10, 190, Color.PURPLE)
 
         # Controls
-        controls = "↑↓:Select A:Enter B:Exit Y:Stealth" if not self.stealth_mode else "↑↓ A:Go B:Exit Y:Exit Stealth"
+        controls = _CONTROLS_STEALTH if self.stealth_mode else _CONTROLS
         self.display.text(controls, 5, 220, Color.GRAY)
 
+    def _selection_row(self, i):
+        """Get (rect x, y, w, h, text x, y, label) of selectable row i on the current screen, or None"""
+        mode = self.current_mode
+        step = self.log_step
+        if mode == "home":
+            items = _MENU_ITEMS_STEALTH if self.stealth_mode else _MENU_ITEMS
+            if i >= len(items):
+                return None
+            y = 50 + i * 25
+            return (5, y - 5, 230, 20, 10, y, items[i])
+
+        if mode != "quick_log" and mode != "deep_log":
+            return None
+
+        if step == 2:
+            # Tags (first 8) or emotions (first 6) in a two column grid
+            if mode == "quick_log":
+                items, limit = self.interaction_tags, 8
+            else:
+                items, limit = self.emotions, 6
+            if i >= limit or i >= len(items):
+                return None
+            x = 10 + (i % 2) * 110
+            y = 55 + (i // 2) * 25
+            return (x - 3, y - 3, 105, 20, x, y, items[i])
+
+        # People, needs and notes as a single column list
+        if step == 0:
+            items = self.people
+        elif mode == "deep_log" and step == 3:
+            items = self.needs
+        elif mode == "deep_log" and step == 4:
+            items = _NOTE_OPTIONS
+        else:
+            return None
+        y = 55 + i * 20
+        if i >= len(items) or y > 180:  # Prevent overflow
+            return None
+        label = items[i]
+        if step == 0:
+            label = label["glyph"] if self.stealth_mode else label["name"]
+        return (5, y - 3, 230, 16, 10, y, label)
+
+    def _draw_row(self, row, selected, clear=True):
+        """Draw one selectable row, highlighted if selected"""
+        rx, ry, rw, rh, tx, ty, label = row
+        if selected:
+            self.display.fill_rect(rx, ry, rw, rh, Color.WHITE)
+            text_color = Color.BLACK
+        else:
+            if clear:
+                self.display.fill_rect(rx, ry, rw, rh, Color.BLACK)
+            text_color = Color.WHITE
+        self.display.text(label, tx, ty, text_color)
+
+    def _draw_rows(self):
+        """Draw every visible selectable row on a freshly cleared screen"""
+        i = 0
+        row = self._selection_row(0)
+        while row is not None:
+            self._draw_row(row, i == self.selected_index, False)
+            i += 1
+            row = self._selection_row(i)
+
+    def _redraw_selection(self, prev):
+        """Redraw only the rows whose highlight moved, or the whole screen"""
+        old = self._selection_row(prev)
+        new = self._selection_row(self.selected_index)
+        if old is None or new is None:
+            self.draw_screen()
+            return
+        if prev != self.selected_index:
+            self._draw_row(old, False)
+            self._draw_row(new, True)
+        self.display.display()
+
     def draw_quick_log_screen(self):
         """Draw quick log interaction screen"""
         self.display.fill(Color.BLACK)
 
         # Title with step indicator
-        step_dots = "●" * (self.log_step + 1) + "○" * (2 - self.log_step)
-        self.display.text(f"QUICK LOG {step_dots}", 60, 5, Color.CYAN)
+        self.display.text(_QUICK_LOG_TITLES[self.log_step], 60, 5, Color.CYAN)
 
         if self.log_step == 0:
             # Step 1: Who?
             self.display.text("Who was it?", 10, 30, Color.WHITE)
 
-            y_start = 55
-            for i, person in enumerate(self.people):
-                y = y_start + i * 20
-                if y > 180:  # Prevent overflow
-                    break
-
-                if i == self.selected_index:
-                    self.display.fill_rect(5, y - 3, 230, 16, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                name = person["glyph"] if self.stealth_mode else person["name"]
-                self.display.text(name, 10, y, text_color)
+            self._draw_rows()
 
         elif self.log_step == 1:
             # Step 2: Vibe & intensity
             self.display.text("How was it?", 10, 30, Color.WHITE)
 
             # Vibe selection
-            vibes = [("⭐ Star (positive)", 1), ("✚ Scar (challenging)", -1)]
-
-            for i, (vibe_text, vibe_val) in enumerate(vibes):
+            for i, (vibe_text, vibe_val) in enumerate(_VIBES):
                 y = 55 + i * 25
                 if i == (0 if self.selected_index >= 0 else 1):
                     self.display.fill_rect(5, y - 3, 230, 20, Color.WHITE)
@@ -286,27 +415,7 @@ class ScarsStars:
             self.display.text("What happened?", 10, 30, Color.WHITE)
 
             # Tags in 2x4 grid
-            rows = 4
-            cols = 2
-            start_x = 10
-            start_y = 55
-
-            for i, tag in enumerate(self.interaction_tags):
-                if i >= 8:  # Show only first 8 tags
-                    break
-
-                row = i // cols
-                col = i % cols
-                x = start_x + col * 110
-                y = start_y + row * 25
-
-                if i == self.selected_index:
-                    self.display.fill_rect(x - 3, y - 3, 105, 20, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                self.display.text(tag, x, y, text_color)
+            self._draw_rows()
 
         # Navigation instructions
         if self.log_step < 2:
@@ -342,35 +451,19 @@ class ScarsStars:
         self.display.fill(Color.BLACK)
 
         # Title with step indicator (5 steps for deep log)
-        step_dots = "●" * (self.log_step + 1) + "○" * (4 - self.log_step)
-        self.display.text(f"DEEP LOG {step_dots}", 65, 5, Color.CYAN)
+        self.display.text(_DEEP_LOG_TITLES[self.log_step], 65, 5, Color.CYAN)
 
         if self.log_step == 0:
             # Step 1: Who? (same as quick log)
             self.display.text("Who was it?", 10, 30, Color.WHITE)
 
-            y_start = 55
-            for i, person in enumerate(self.people):
-                y = y_start + i * 20
-                if y > 180:
-                    break
-
-                if i == self.selected_index:
-                    self.display.fill_rect(5, y - 3, 230, 16, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                name = person["glyph"] if self.stealth_mode else person["name"]
-                self.display.text(name, 10, y, text_color)
+            self._draw_rows()
 
         elif self.log_step == 1:
             # Step 2: Vibe & intensity (same as quick log)
             self.display.text("How was it?", 10, 30, Color.WHITE)
 
-            vibes = [("⭐ Star (positive)", 1), ("✚ Scar (challenging)", -1)]
-
-            for i, (vibe_text, vibe_val) in enumerate(vibes):
+            for i, (vibe_text, vibe_val) in enumerate(_VIBES):
                 y = 55 + i * 25
                 if i == (0 if self.selected_index >= 0 else 1):
                     self.display.fill_rect(5, y - 3, 230, 20, Color.WHITE)
@@ -386,69 +479,19 @@ class ScarsStars:
             # Step 3: What I felt (emotions)
             self.display.text("What did you feel?", 10, 30, Color.WHITE)
 
-            rows = 3
-            cols = 2
-            start_x = 10
-            start_y = 55
-
-            for i, emotion in enumerate(self.emotions):
-                if i >= 6:
-                    break
-
-                row = i // cols
-                col = i % cols
-                x = start_x + col * 110
-                y = start_y + row * 25
-
-                if i == self.selected_index:
-                    self.display.fill_rect(x - 3, y - 3, 105, 20, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                self.display.text(emotion, x, y, text_color)
+            # Emotions in 2x3 grid
+            self._draw_rows()
 
         elif self.log_step == 3:
             # Step 4: What I needed
             self.display.text("What did you need?", 10, 30, Color.WHITE)
 
-            for i, need in enumerate(self.needs):
-                y = 55 + i * 20
-                if y > 180:
-                    break
-
-                if i == self.selected_index:
-                    self.display.fill_rect(5, y - 3, 230, 16, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                self.display.text(need, 10, y, text_color)
+            self._draw_rows()
 
         elif self.log_step == 4:
             # Step 5: One line note (simplified for now)
             self.display.text("Quick note:", 10, 30, Color.WHITE)
-            note_options = [
-                "felt overwhelmed",
-                "they really got it",
-                "miscommunication",
-                "felt supported",
-                "boundary crossed",
-                "great connection"
-            ]
-
-            for i, note in enumerate(note_options):
-                y = 55 + i * 20
-                if y > 180:
-                    break
-
-                if i == self.selected_index:
-                    self.display.fill_rect(5, y - 3, 230, 16, Color.WHITE)
-                    text_color = Color.BLACK
-                else:
-                    text_color = Color.WHITE
-
-                self.display.text(note, 10, y, text_color)
+            self._draw_rows()
 
         # Navigation instructions
         if self.log_step < 4:
@@ -464,7 +507,7 @@ class ScarsStars:
         self.display.text("REPAIR RITUAL", 65, 5, Color.CYAN)
 
         # Show unresolved scars count
-        unresolved_scars = [e for e in self.entries if e["valence"] < 0 and self.calculate_healing_score(e) > 0]
+        unresolved_scars = self.get_unresolved_scars()
         self.display.text(f"Scars needing care: {len(unresolved_scars)}", 10, 25, Color.GRAY)
 
         if len(unresolved_scars) == 0:
@@ -494,12 +537,12 @@ class ScarsStars:
     def start_repair_ritual(self, repair_type):
         """Start repair ritual flow"""
         # Find most recent unresolved scar
-        unresolved_scars = [e for e in self.entries if e["valence"] < 0 and self.calculate_healing_score(e) > 0]
+        unresolved_scars = self.get_unresolved_scars()
         if not unresolved_scars:
             return
 
-        # Sort by timestamp, get most recent
-        recent_scar = sorted(unresolved_scars, key=lambda x: x["ts"], reverse=True)[0]
+        # Most recent by timestamp, first one wins a tie
+        recent_scar = max(unresolved_scars, key=lambda x: x["ts"])
 
         # Create repair action
         repair_action = {
@@ -511,7 +554,12 @@ class ScarsStars:
         }
 
         self.repair_queue.append(repair_action)
-        self.save_data()
+        self._repairs_by_eid.setdefault(repair_action["eid"], []).append(repair_action)
+        self.unresolved_count += 1
+        self._unresolved_scars = None
+        self._stats_text = None
+        self._dirty["repair"] = True
+        self.save_repair_queue()
 
         # Show repair guidance
         self.show_repair_guidance(repair_action, recent_scar)
@@ -630,17 +678,20 @@ class ScarsStars:
 
         # Draw entries as constellation
         for i, entry in enumerate(self.entries):
-            # Generate stable position based on person ID and timestamp
-            pos = self.generate_constellation_position(entry, const_x, const_y, const_size)
+            # Stable position based on person ID and timestamp, computed once per entry
+            if "_x" not in entry:
+                self.generate_constellation_position(entry, const_x, const_y, const_size)
+            x = entry["_x"]
+            y = entry["_y"]
 
             if entry["valence"] > 0:
                 # Star
-                self.draw_star(pos["x"], pos["y"], Color.YELLOW)
+                self.draw_star(x, y, Color.YELLOW)
             else:
                 # Scar/stitch
                 healing_score = self.calculate_healing_score(entry)
                 stitch_color = self.get_healing_color(healing_score)
-                self.draw_stitch(pos["x"], pos["y"], stitch_color)
+                self.draw_stitch(x, y, stitch_color)
 
         # Cursor
         cursor_x = max(const_x, min(const_x + const_size - 5, self.constellation_cursor["x"]))
@@ -653,24 +704,29 @@ class ScarsStars:
 
     def generate_constellation_position(self, entry, base_x, base_y, size):
         """Generate stable position for entry using deterministic spiral"""
-        # Seed based on person ID and timestamp for stability
-        seed_val = hash(entry["pid"] + str(entry["ts"])) % 10000
-        random.seed(seed_val)
+        # Cached on the entry, the constellation area never changes
+        if "_x" in entry:
+            return {"x": entry["_x"], "y": entry["_y"]}
+
+        # Integer mix of timestamp and person for stability, no string hashing
+        seed_val = (entry["ts"] * 2654435761 ^ self._pid_index.get(entry["pid"], 0) * 40503) & 0xFFFF
 
         # Spiral parameters
-        angle = (seed_val % 360) * (math.pi / 180)
+        angle = seed_val % 360
         radius = (seed_val % 70) + 10  # 10-80 pixel radius from center
 
         center_x = base_x + size // 2
         center_y = base_y + size // 2
 
-        x = center_x + int(radius * math.cos(angle))
-        y = center_y + int(radius * math.sin(angle))
+        x = center_x + int(radius * _COS[angle])
+        y = center_y + int(radius * _SIN[angle])
 
         # Clamp to bounds
         x = max(base_x + 2, min(base_x + size - 2, x))
         y = max(base_y + 2, min(base_y + size - 2, y))
 
+        entry["_x"] = x
+        entry["_y"] = y
         return {"x": x, "y": y}
 
     def draw_star(self, x, y, color):
@@ -696,9 +752,11 @@ class ScarsStars:
 
         base_score = abs(entry["valence"])
 
-        # Reduce by completed repair actions
-        completed_repairs = len([r for r in self.repair_queue
-                               if r.get("eid") == entry["id"] and r["status"] == "completed"])
+        # Reduce by completed repair actions for this entry
+        completed_repairs = 0
+        for r in self._repairs_by_eid.get(entry["id"], ()):
+            if r["status"] == "completed":
+                completed_repairs += 1
 
         # Time decay (weekly -0.25)
         weeks_passed = (time.time() - entry["ts"]) / (7 * 24 * 3600)
@@ -743,8 +801,14 @@ class ScarsStars:
 
     def init(self):
         """Initialize app"""
+        # A deadline from boot time can read as future once ticks pass 2^29
+        self._cooldown_until = time.ticks_ms()
         self.draw_screen()
 
+    def _cooldown(self, ms):
+        """Ignore input for the next ms milliseconds without blocking"""
+        self._cooldown_until = time.ticks_add(time.ticks_ms(), ms)
+
     def update(self):
         """Update Scars & Stars app"""
         self.buttons.update()
@@ -752,17 +816,23 @@ class ScarsStars:
         # Update stealth pulse
         self.update_stealth_pulse()
 
+        # Debounce after the last action, returning so the main loop keeps running
+        if time.ticks_diff(self._cooldown_until, time.ticks_ms()) > 0:
+            return True
+
         if self.current_mode == "home":
             # Home navigation
             if not self.joystick.up_pin.value():
+                prev = self.selected_index
                 self.selected_index = (self.selected_index - 1) % 5
-                self.draw_screen()
-                time.sleep_ms(150)
+                self._redraw_selection(prev)
+                self._cooldown(150)
 
             elif not self.joystick.down_pin.value():
+                prev = self.selected_index
                 self.selected_index = (self.selected_index + 1) % 5
-                self.draw_screen()
-                time.sleep_ms(150)
+                self._redraw_selection(prev)
+                self._cooldown(150)
 
             elif self.buttons.is_pressed('A'):
                 if self.selected_index == 0:
@@ -772,6 +842,8 @@ class ScarsStars:
                 elif self.selected_index == 2:
                     self.current_mode = "repair"
                     self.selected_index = 0
+                    # Healing decays with time, so refresh on entry
+                    self._unresolved_scars = None
                 elif self.selected_index == 3:
                     self.current_mode = "constellation"
                     self.selected_index = 0
@@ -779,7 +851,7 @@ class ScarsStars:
                     self.current_mode = "values"
                     self.selected_index = 0
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
             elif self.buttons.is_pressed('B'):
                 # Exit app
@@ -788,13 +860,14 @@ class ScarsStars:
             elif self.buttons.is_pressed('Y'):
                 # Toggle stealth mode
                 self.stealth_mode = not self.stealth_mode
+                self._stats_text = None
                 if self.stealth_mode:
                     self.pulse_active = True
                     self.last_pulse = time.ticks_ms()
                 else:
                     self.pulse_active = False
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
         elif self.current_mode == "quick_log":
             self.handle_quick_log_input()
@@ -810,32 +883,32 @@ class ScarsStars:
                 self.current_mode = "home"
                 self.selected_index = 0
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
         elif self.current_mode == "constellation":
             if self.buttons.is_pressed('B'):
                 self.current_mode = "home"
                 self.selected_index = 0
                 self.draw_screen()
-                time.sleep_ms(200)
+                self._cooldown(200)
 
             # Constellation cursor movement
             if not self.joystick.left_pin.value():
                 self.constellation_cursor["x"] = max(40, self.constellation_cursor["x"] - 5)
                 self.draw_screen()
-                time.sleep_ms(100)
+                self._cooldown(100)
             elif not self.joystick.right_pin.value():
                 self.constellation_cursor["x"] = min(195, self.constellation_cursor["x"] + 5)
                 self.draw_screen()
-                time.sleep_ms(100)
+                self._cooldown(100)
             elif not self.joystick.up_pin.value():
                 self.constellation_cursor["y"] = max(40, self.constellation_cursor["y"] - 5)
                 self.draw_screen()
-                time.sleep_ms(100)
+                self._cooldown(100)
             elif not self.joystick.down_pin.value():
                 self.constellation_cursor["y"] = min(195, self.constellation_cursor["y"] + 5)
                 self.draw_screen()
-                time.sleep_ms(100)
+                self._cooldown(100)
 
         return True
 
@@ -849,7 +922,7 @@ class ScarsStars:
                 self.current_mode = "home"
                 self.selected_index = 0
                 self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         elif self.buttons.is_pressed('A'):
             if self.log_step == 0:
@@ -875,10 +948,11 @@ class ScarsStars:
                     self.complete_log()
 
             self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         # Navigation within current step
         elif not self.joystick.up_pin.value():
+            prev = self.selected_index
             if self.log_step == 0:
                 self.selected_index = (self.selected_index - 1) % len(self.people)
             elif self.log_step == 1:
@@ -891,10 +965,11 @@ class ScarsStars:
                         self.current_log["valence"] = min(-1, current_val + 1)
             elif self.log_step == 2:
                 self.selected_index = (self.selected_index - 1) % len(self.interaction_tags)
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._redraw_selection(prev)
+            self._cooldown(150)
 
         elif not self.joystick.down_pin.value():
+            prev = self.selected_index
             if self.log_step == 0:
                 self.selected_index = (self.selected_index + 1) % len(self.people)
             elif self.log_step == 1:
@@ -907,8 +982,8 @@ class ScarsStars:
                         self.current_log["valence"] = max(-3, current_val - 1)
             elif self.log_step == 2:
                 self.selected_index = (self.selected_index + 1) % len(self.interaction_tags)
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._redraw_selection(prev)
+            self._cooldown(150)
 
     def handle_deep_log_input(self):
         """Handle input for deep log mode"""
@@ -920,7 +995,7 @@ class ScarsStars:
                 self.current_mode = "home"
                 self.selected_index = 0
                 self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         elif self.buttons.is_pressed('A'):
             if self.log_step == 0:
@@ -955,19 +1030,16 @@ class ScarsStars:
 
             elif self.log_step == 4:
                 # Select note and complete
-                note_options = [
-                    "felt overwhelmed", "they really got it", "miscommunication",
-                    "felt supported", "boundary crossed", "great connection"
-                ]
-                if self.selected_index < len(note_options):
-                    self.current_log["note"] = note_options[self.selected_index]
+                if self.selected_index < len(_NOTE_OPTIONS):
+                    self.current_log["note"] = _NOTE_OPTIONS[self.selected_index]
                     self.complete_log()
 
             self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         # Navigation
         elif not self.joystick.up_pin.value():
+            prev = self.selected_index
             if self.log_step == 0:
                 self.selected_index = (self.selected_index - 1) % len(self.people)
             elif self.log_step == 1:
@@ -983,10 +1055,11 @@ class ScarsStars:
                 self.selected_index = (self.selected_index - 1) % len(self.needs)
             elif self.log_step == 4:
                 self.selected_index = (self.selected_index - 1) % 6
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._redraw_selection(prev)
+            self._cooldown(150)
 
         elif not self.joystick.down_pin.value():
+            prev = self.selected_index
             if self.log_step == 0:
                 self.selected_index = (self.selected_index + 1) % len(self.people)
             elif self.log_step == 1:
@@ -1002,8 +1075,8 @@ class ScarsStars:
                 self.selected_index = (self.selected_index + 1) % len(self.needs)
             elif self.log_step == 4:
                 self.selected_index = (self.selected_index + 1) % 6
-            self.draw_screen()
-            time.sleep_ms(150)
+            self._redraw_selection(prev)
+            self._cooldown(150)
 
     def handle_repair_input(self):
         """Handle input for repair ritual mode"""
@@ -1011,26 +1084,26 @@ class ScarsStars:
             self.current_mode = "home"
             self.selected_index = 0
             self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         elif self.buttons.is_pressed('A'):
             # Check if there are unresolved scars
-            unresolved_scars = [e for e in self.entries if e["valence"] < 0 and self.calculate_healing_score(e) > 0]
+            unresolved_scars = self.get_unresolved_scars()
             if unresolved_scars and self.selected_index < len(self.repair_types):
                 repair_type = self.repair_types[self.selected_index]
                 self.start_repair_ritual(repair_type)
             self.draw_screen()
-            time.sleep_ms(200)
+            self._cooldown(200)
 
         elif not self.joystick.up_pin.value():
             self.selected_index = (self.selected_index - 1) % len(self.repair_types)
             self.draw_screen()
-            time.sleep_ms(150)
+            self._cooldown(150)
 
         elif not self.joystick.down_pin.value():
             self.selected_index = (self.selected_index + 1) % len(self.repair_types)
             self.draw_screen()
-            time.sleep_ms(150)
+            self._cooldown(150)
 
     def cleanup(self):
         """Cleanup when exiting app"""